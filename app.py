@@ -3,20 +3,49 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from collections import Counter
 from math import log2
-from lzw import LZWCompressor, LZWDecompressor
+from lzwcompressor.lzw import LZWCompressor, LZWDecompressor
+from lzwcompressor.dynamic import LZWCompressorDynamic, LZWDecompressorDynamic
+from lzwcompressor.report_data import load_report_data
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+import hashlib
+import os
 import random
 import string
+import threading
 import time
 
-# Função para carregar os dados do CSV automaticamente
+# Entradas a partir desse tamanho são comprimidas em segundo plano, com barra de progresso
+LARGE_INPUT = 50000
+# Quantidade de caracteres e de códigos exibidos nas prévias
+PREVIEW_SIZE = 2000
+
+# Versão dos resultados: muda sempre que o CSV de benchmarks é atualizado
+def data_version(csv_file):
+    return os.path.getmtime(csv_file) if os.path.isfile(csv_file) else 0
+
+# Função para carregar apenas os agregados pré-calculados dos resultados
 @st.cache_data
-def load_data(csv_file):
-    return pd.read_csv(csv_file)
+def load_report(csv_file, version):
+    return load_report_data(csv_file)
+
+# Gráfico da taxa de compressão por tamanho, guardado em cache para cada nível selecionado
+@st.cache_resource
+def rate_by_size_figure(csv_file, version, level):
+    by_size = load_report(csv_file, version)["by_size"]
+    filtered_data = by_size[by_size["Entropy Level"] == level]
+    if filtered_data.empty:
+        return None
+    fig, ax = plt.subplots()
+    ax.plot(filtered_data["Input Size"], filtered_data["Compression Rate"], marker="x", linestyle="--")
+    ax.set_xlabel("Tamanho da Entrada")
+    ax.set_ylabel("Taxa de Compressão")
+    ax.set_title(f"Taxa de Compressão por Tamanho para Nível de Entropia {level}")
+    return fig
 
 # Função para gerar texto aleatório
 def generate_random_text(size):
     caracteres = string.ascii_letters + string.digits + string.punctuation + ' '
-    return ''.join(random.choice(caracteres) for _ in range(size))
+    return ''.join(random.choices(caracteres, k=size))
 
 # Função para calcular a entropia de um texto
 def calculate_entropy(text):
@@ -28,6 +57,48 @@ def calculate_entropy(text):
         entropy -= probability * log2(probability)
     return entropy
 
+# Função para comprimir com cache: a chave é o hash do conteúdo, max_bits e a variante
+# O texto e o progresso começam com "_" para não entrarem no hash calculado pelo Streamlit
+@st.cache_data(max_entries=32)
+def compress_cached(digest, max_bits, variant, _text, _progress=None):
+    compressor = LZWCompressorDynamic(max_bits=max_bits) if variant == "Dinâmico" else LZWCompressor(max_bits=max_bits)
+    chunk_size = 65536
+    compressed_data = []
+    start_time = time.time()
+    for i, codes in enumerate(compressor.compress_iter(_text, chunk_size)):
+        compressed_data.extend(codes)
+        if _progress is not None:
+            _progress[0] = min(1.0, (i + 1) * chunk_size / max(1, len(_text)))
+    return compressed_data, time.time() - start_time
+
+# Função para descomprimir com cache, usando a mesma chave da compressão
+@st.cache_data(max_entries=32)
+def decompress_cached(digest, max_bits, variant, _compressed_data):
+    decompressor = LZWDecompressorDynamic(max_bits=max_bits) if variant == "Dinâmico" else LZWDecompressor(max_bits=max_bits)
+    start_time = time.time()
+    decompressed_data = decompressor.decompress(_compressed_data)
+    return decompressed_data, time.time() - start_time
+
+# Função que comprime entradas grandes em uma thread, atualizando a barra de progresso
+def compress_with_progress(digest, max_bits, variant, text):
+    if len(text) < LARGE_INPUT:
+        return compress_cached(digest, max_bits, variant, text)
+
+    progress = [0.0]
+    result = []
+    worker = threading.Thread(target=lambda: result.append(compress_cached(digest, max_bits, variant, text, progress)))
+    add_script_run_ctx(worker)
+    worker.start()
+    bar = st.progress(0.0, text="Comprimindo...")
+    while worker.is_alive():
+        bar.progress(progress[0], text=f"Comprimindo... {progress[0]:.0%}")
+        time.sleep(0.1)
+    worker.join()
+    bar.empty()
+    if not result:
+        raise RuntimeError("A compressão em segundo plano falhou")
+    return result[0]
+
 # Página Introdução
 def show_introduction():
     st.title("Trabalho Prático 1 de Algoritmos II - LZW")
@@ -106,12 +177,15 @@ def show_report():
     # Carrega os dados do CSV automaticamente
     csv_file = "lzw_analysis.csv"  # Nome do arquivo no diretório
     try:
-        data = load_data(csv_file)
+        version = data_version(csv_file)
+        report = load_report(csv_file, version)
+        # Os gráficos de dispersão usam uma amostra estratificada por nível
+        data = report["sample"]
 
-        st.markdown("""As estatísticas para os testes foram salvas em um arquivo CSV. A estrutura do arquivo pode ser vista abaixo""")
+        st.markdown("""As estatísticas para os testes foram salvas em um arquivo CSV. As médias por nível de entropia podem ser vistas abaixo""")
         # Exibe o DataFrame
-        st.write("### Dados do CSV")
-        st.write(data)
+        st.write("### Dados do CSV (médias por nível de entropia)")
+        st.write(report["by_level"])
 
         
         # Gráfico 1: Entropia por Nível de Entrada
@@ -125,7 +199,6 @@ def show_report():
         st.markdown(""" Neste gráfico, podemos observar como se comportaram os níveis de entropia que configuramos para os geradores de casos de teste. Tendo em vista que o nível 9 abarca textos completamente aleatórios, conseguimos capturar bem vários níveis.""")
 
         # Gráfico 2: Relação entre Entropia e Eficiência de Compressão (%)
-        data["Compression Efficiency (%)"] = (1 - data["Compression Rate"]) * 100
         st.write("### Relação entre Entropia e Eficiência de Compressão (%)")
         fig, ax = plt.subplots()
         ax.scatter(data["Entropy"], data["Compression Efficiency (%)"], c='green', alpha=0.7, edgecolors='w', s=80)
@@ -149,27 +222,22 @@ def show_report():
 
         # Gráfico 4: Taxa de Compressão por Tamanho para cada Nível de Entropia
         st.write("### Taxa de Compressão por Tamanho para cada Nível de Entropia")
-        entropy_levels = data["Entropy Level"].unique()
+        entropy_levels = report["by_level"]["Entropy Level"]
         selected_level = st.selectbox("Selecione o Nível de Entropia", entropy_levels)
-        filtered_data = data[data["Entropy Level"] == selected_level]
-
-        if not filtered_data.empty:
-            fig, ax = plt.subplots()
-            ax.plot(filtered_data["Input Size"], filtered_data["Compression Rate"], marker="x", linestyle="--")
-            ax.set_xlabel("Tamanho da Entrada")
-            ax.set_ylabel("Taxa de Compressão")
-            ax.set_title(f"Taxa de Compressão por Tamanho para Nível de Entropia {selected_level}")
+        fig = rate_by_size_figure(csv_file, version, selected_level)
+
+        if fig is not None:
             st.pyplot(fig)
         else:
             st.warning("Nenhum dado disponível para o nível de entropia selecionado.")
         st.markdown("""Aqui, podemos ver que a taxa de compressão não é sensível à entrada: se observarmos o eixo y de todos os gráficos para os níveis diferentes de entropia, o valor da taxa de compressão pouco muda.""")
         # Gráfico Interativo
         st.write("### Gráfico Interativo: Input Size vs. Compression Rate")
-        st.line_chart(data[["Input Size", "Compression Rate"]])
+        st.line_chart(report["by_size"].groupby("Size Bucket")[["Input Size", "Compression Rate"]].mean(), x="Input Size")
 
         # Estatísticas Descritivas
         st.write("### Estatísticas Descritivas dos Dados")
-        st.write(data.describe())
+        st.write(report["describe"])
 
     except FileNotFoundError:
         st.error(f"O arquivo '{csv_file}' não foi encontrado no diretório do aplicativo.")
@@ -186,12 +254,15 @@ def show_dynamic_report():
     # Carrega os dados do CSV automaticamente
     csv_file = "lzw_dynamic_analysis.csv"  # Nome do arquivo dinâmico no diretório
     try:
-        data = load_data(csv_file)
+        version = data_version(csv_file)
+        report = load_report(csv_file, version)
+        # Os gráficos de dispersão usam uma amostra estratificada por nível
+        data = report["sample"]
 
-        st.markdown("""As estatísticas para os testes foram salvas em um arquivo CSV. A estrutura do arquivo pode ser vista abaixo""")
+        st.markdown("""As estatísticas para os testes foram salvas em um arquivo CSV. As médias por nível de entropia podem ser vistas abaixo""")
         # Exibe o DataFrame
-        st.write("### Dados do CSV")
-        st.write(data)
+        st.write("### Dados do CSV (médias por nível de entropia)")
+        st.write(report["by_level"])
 
         # Gráfico 1: Entropia por Nível de Entrada
         st.write("### Entropia por Nível de Entrada")
@@ -203,7 +274,6 @@ def show_dynamic_report():
         st.pyplot(fig)
 
         # Gráfico 2: Relação entre Entropia e Eficiência de Compressão (%)
-        data["Compression Efficiency (%)"] = (1 - data["Compression Rate"]) * 100
         st.write("### Relação entre Entropia e Eficiência de Compressão (%)")
         fig, ax = plt.subplots()
         ax.scatter(data["Entropy"], data["Compression Efficiency (%)"], c='blue', alpha=0.7, edgecolors='w', s=80)
@@ -226,16 +296,11 @@ def show_dynamic_report():
 
         # Gráfico 4: Taxa de Compressão por Tamanho para cada Nível de Entropia
         st.write("### Taxa de Compressão por Tamanho para cada Nível de Entropia")
-        entropy_levels = data["Entropy Level"].unique()
+        entropy_levels = report["by_level"]["Entropy Level"]
         selected_level = st.selectbox("Selecione o Nível de Entropia", entropy_levels)
-        filtered_data = data[data["Entropy Level"] == selected_level]
-
-        if not filtered_data.empty:
-            fig, ax = plt.subplots()
-            ax.plot(filtered_data["Input Size"], filtered_data["Compression Rate"], marker="x", linestyle="--")
-            ax.set_xlabel("Tamanho da Entrada")
-            ax.set_ylabel("Taxa de Compressão")
-            ax.set_title(f"Taxa de Compressão por Tamanho para Nível de Entropia {selected_level}")
+        fig = rate_by_size_figure(csv_file, version, selected_level)
+
+        if fig is not None:
             st.pyplot(fig)
         else:
             st.warning("Nenhum dado disponível para o nível de entropia selecionado.")
@@ -243,11 +308,11 @@ def show_dynamic_report():
         # Gráfico Interativo
 
         st.write("### Gráfico Interativo: Input Size vs. Compression Rate")
-        st.line_chart(data[["Input Size", "Compression Rate"]])
+        st.line_chart(report["by_size"].groupby("Size Bucket")[["Input Size", "Compression Rate"]].mean(), x="Input Size")
 
         # Estatísticas Descritivas
         st.write("### Estatísticas Descritivas dos Dados")
-        st.write(data.describe())
+        st.write(report["describe"])
 
     except FileNotFoundError:
         st.error(f"O arquivo '{csv_file}' não foi encontrado no diretório do aplicativo.")
@@ -272,6 +337,7 @@ def show_interactive_page():
     # Parâmetros de Configuração
     st.markdown("### Parâmetros de Configuração")
     max_bits = st.slider("Número máximo de bits", min_value=9, max_value=16, value=12)
+    variant = st.radio("Variante do LZW", ("Padrão", "Dinâmico"), horizontal=True)
 
     st.markdown("### Gerador de Texto Aleatório")
     text_size = st.slider("Tamanho do Texto Aleatório", min_value=100, max_value=5000, value=1000)
@@ -286,29 +352,31 @@ def show_interactive_page():
         st.write(f"**Entropia do Texto Gerado:** {entropy_value:.4f} bits")
 
     st.markdown("### Teste Interativo de Compressão e Descompressão")
-    input_text = st.text_area("Digite o texto para compressão", st.session_state['generated_text'] if st.session_state['generated_text'] else "ABABABABAABABABABABA")
+    uploaded_file = st.file_uploader("Envie um arquivo para compressão (opcional)")
+    if uploaded_file is not None:
+        # arquivos enviados substituem o texto digitado
+        input_text = uploaded_file.getvalue().decode('latin1')
+        st.write(f"**Arquivo:** {uploaded_file.name} ({len(input_text)} caracteres)")
+        st.text(input_text[:PREVIEW_SIZE])
+    else:
+        input_text = st.text_area("Digite o texto para compressão", st.session_state['generated_text'] if st.session_state['generated_text'] else "ABABABABAABABABABABA")
 
-    # Inicialize o compressor e o decompressor antes dos botões
-    compressor = LZWCompressor(max_bits=max_bits)
-    decompressor = LZWDecompressor(max_bits=max_bits)
+    digest = hashlib.sha256(input_text.encode('utf-8', errors='surrogatepass')).hexdigest()
 
     # Botão de compressão
     if st.button("Comprimir"):
-        start_time = time.time()
-        compressed_data = compressor.compress(input_text)
-        end_time = time.time()
+        compressed_data, execution_time = compress_with_progress(digest, max_bits, variant, input_text)
         
         # Calcular métricas
         input_size = len(input_text)
         compressed_size = len(compressed_data)
         compression_ratio = compressed_size / input_size if input_size > 0 else 0
-        execution_time = end_time - start_time
         
         # Calcular a entropia do texto comprimido
         entropy_value = calculate_entropy(input_text)
         
         # Exibir resultados
-        st.write("**Dados Comprimidos:**", compressed_data)
+        st.write(f"**Dados Comprimidos:** {compressed_size} códigos (exibindo até {PREVIEW_SIZE})", compressed_data[:PREVIEW_SIZE])
         st.write(f"**Taxa de Compressão:** {compression_ratio:.2f}")
         st.write(f"**Tempo de Execução:** {execution_time:.4f} segundos")
         st.write(f"**Entropia do Texto:** {entropy_value:.4f} bits")
@@ -316,6 +384,7 @@ def show_interactive_page():
         # Armazenar dados na sessão
         st.session_state['attempts'].append({
             'operation': 'Compressão',
+            'variant': variant,
             'input_size': input_size,
             'output_size': compressed_size,
             'compression_ratio': compression_ratio,
@@ -323,23 +392,22 @@ def show_interactive_page():
             'entropy': entropy_value
         })
         
-        # Salva o texto comprimido na sessão para permitir descompressão
-        st.session_state['compressed_data'] = compressed_data
+        # Salva a chave e os parâmetros da compressão na sessão para permitir descompressão
+        st.session_state['compressed_data'] = (digest, max_bits, variant, compressed_data)
 
     # Botão de descompressão
     if st.button("Descomprimir") and st.session_state['compressed_data'] is not None:
-        start_time = time.time()
-        decompressed_data = decompressor.decompress(st.session_state['compressed_data'])
-        end_time = time.time()
+        compressed_digest, compressed_bits, compressed_variant, compressed_data = st.session_state['compressed_data']
+        decompressed_data, execution_time = decompress_cached(compressed_digest, compressed_bits, compressed_variant, compressed_data)
         
-        execution_time = end_time - start_time
         output_size = len(decompressed_data)
-        input_size = len(st.session_state['compressed_data'])
+        input_size = len(compressed_data)
         
         # Calcular a entropia do texto descomprimido
         entropy_value = calculate_entropy(decompressed_data)
         
-        st.write("**Texto Descomprimido:**", decompressed_data)
+        st.write(f"**Texto Descomprimido:** (exibindo até {PREVIEW_SIZE} caracteres)")
+        st.text(decompressed_data[:PREVIEW_SIZE])
         st.write(f"**Tamanho do Texto Descomprimido:** {output_size}")
         st.write(f"**Tempo de Execução:** {execution_time:.4f} segundos")
         st.write(f"**Entropia do Texto Descomprimido:** {entropy_value:.4f} bits")
@@ -347,6 +415,7 @@ def show_interactive_page():
         # Armazenar dados na sessão
         st.session_state['attempts'].append({
             'operation': 'Descompressão',
+            'variant': compressed_variant,
             'input_size': input_size,
             'output_size': output_size,
             'execution_time': execution_time,
@@ -0,0 +1,6 @@
+# atalho para executar a partir do repositorio (python archive.py ...); o codigo fica em lzwcompressor/archive.py
+from lzwcompressor.archive import *  # noqa: F401,F403
+from lzwcompressor.archive import main
+
+if __name__ == "__main__":
+    main()
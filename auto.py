@@ -0,0 +1,6 @@
+# atalho para executar a partir do repositorio (python auto.py ...); o codigo fica em lzwcompressor/auto.py
+from lzwcompressor.auto import *  # noqa: F401,F403
+from lzwcompressor.auto import main
+
+if __name__ == "__main__":
+    main()
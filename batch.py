@@ -0,0 +1,2 @@
+# atalho para importar a partir do repositorio; o codigo fica em lzwcompressor/batch.py
+from lzwcompressor.batch import *  # noqa: F401,F403
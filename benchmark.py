@@ -0,0 +1,6 @@
+# atalho para executar a partir do repositorio (python benchmark.py ...); o codigo fica em lzwcompressor/benchmark.py
+from lzwcompressor.benchmark import *  # noqa: F401,F403
+from lzwcompressor.benchmark import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+# atalho para executar a partir do repositorio (python blocks.py ...); o codigo fica em lzwcompressor/blocks.py
+from lzwcompressor.blocks import *  # noqa: F401,F403
+from lzwcompressor.blocks import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+# atalho para executar a partir do repositorio (python dedup.py ...); o codigo fica em lzwcompressor/dedup.py
+from lzwcompressor.dedup import *  # noqa: F401,F403
+from lzwcompressor.dedup import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+# atalho para executar a partir do repositorio (python lru.py ...); o codigo fica em lzwcompressor/lru.py
+from lzwcompressor.lru import *  # noqa: F401,F403
+from lzwcompressor.lru import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+# pacote instalavel do compressor LZW
+# apenas os codecs basicos sao expostos aqui; eles dependem somente da biblioteca padrao
+# os demais modulos (auto, lru, blocks, archive, dedup, search, batch...) sao importados sob demanda
+from .lzw import LZWCompressor, LZWDecompressor
+from .dynamic import LZWCompressorDynamic, LZWDecompressorDynamic
+
+__all__ = ["LZWCompressor", "LZWDecompressor", "LZWCompressorDynamic", "LZWDecompressorDynamic"]
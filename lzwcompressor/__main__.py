@@ -0,0 +1,52 @@
+import importlib
+import sys
+
+# subcomandos e os modulos que os implementam
+# cada modulo so e importado quando o seu subcomando e usado, para que a inicializacao
+# dos codecs carregue apenas a biblioteca padrao
+COMMANDS = {
+    "lzw": ("lzw", "LZW with a fixed 12-bit dictionary (compress/decompress)"),
+    "dynamic": ("dynamic", "LZW with dynamic code size"),
+    "auto": ("auto", "pick variant and max_bits by sampling the input"),
+    "lru": ("lru", "LZW with LRU dictionary replacement under a memory budget"),
+    "blocks": ("blocks", "parallel blocks with primed dictionaries"),
+    "archive": ("archive", "appendable archive (compress/append/decompress)"),
+    "dedup": ("dedup", "content-defined chunking with cross-file deduplication"),
+    "grep": ("search", "search inside a compressed file"),
+    "benchmark": ("benchmark", "parallel benchmark runner (needs numpy and pandas)"),
+}
+
+# atalhos: "compress" e "decompress" usam o LZW padrao
+SHORTCUTS = {"compress": "lzw", "decompress": "lzw"}
+
+
+def usage(prog):
+    lines = [f"usage: {prog} <command> [args...]", "", "commands:"]
+    lines += [f"  {name:<10} {description}" for name, (_, description) in COMMANDS.items()]
+    lines += [f"  {name:<10} shortcut for '{target} {name}'" for name, target in SHORTCUTS.items()]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    prog = "lzw-tool"
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage(prog))
+        return 0 if argv else 2
+
+    command, args = argv[0], argv[1:]
+    if command in SHORTCUTS:
+        command, args = SHORTCUTS[command], argv
+    if command not in COMMANDS:
+        print(f"{prog}: unknown command '{command}'\n\n{usage(prog)}", file=sys.stderr)
+        return 2
+
+    # cada modulo le os argumentos de sys.argv com o seu proprio argparse
+    module = importlib.import_module(f".{COMMANDS[command][0]}", __package__)
+    sys.argv = [f"{prog} {command}", *args]
+    # os main() dos modulos retornam 1 em caso de erro e None em caso de sucesso
+    return module.main() or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
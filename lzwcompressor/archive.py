@@ -0,0 +1,195 @@
+import argparse
+import os
+import struct
+
+from .blocks import compress_segment, decompress_segment
+
+# arquivo comprimido que aceita novos dados no final sem reler nem recomprimir os anteriores
+# o arquivo e uma sequencia de segmentos, um por escrita:
+#   blocos | indice | trailer
+# cada bloco e comprimido com o dicionario inicial e pode ser decodificado sozinho
+# o indice guarda (numero de codigos, tamanho original) de cada bloco do segmento
+# o trailer guarda o numero de blocos do segmento e onde o segmento anterior termina,
+# formando uma cadeia que o leitor percorre a partir do fim do arquivo
+
+MAGIC = b'LZWA'
+TRAILER = struct.Struct('>4sBIQ')  # magic, max_bits, numero de blocos, fim do segmento anterior
+INDEX_ENTRY = struct.Struct('>IQ')  # numero de codigos, tamanho original
+
+
+# le e valida o segmento que termina na posicao end
+# retorna (max_bits, fim do segmento anterior, entradas do indice), ou None se o trailer ou o
+# indice forem invalidos
+def _read_segment(f, end):
+    if end < TRAILER.size:
+        return None
+    f.seek(end - TRAILER.size)
+    magic, max_bits, block_count, previous_end = TRAILER.unpack(f.read(TRAILER.size))
+    index_start = end - TRAILER.size - block_count * INDEX_ENTRY.size
+    if magic != MAGIC or not previous_end <= index_start:
+        return None
+    f.seek(index_start)
+    entries = [INDEX_ENTRY.unpack(f.read(INDEX_ENTRY.size)) for _ in range(block_count)]
+    # os blocos do segmento precisam ocupar exatamente o espaco entre o segmento anterior e o indice
+    if previous_end + sum(code_count * 2 for code_count, _ in entries) != index_start:
+        return None
+    return max_bits, previous_end, entries
+
+
+# percorre a cadeia de segmentos que termina na posicao end, validando cada trailer e indice
+# retorna (max_bits, segmentos do ultimo ao primeiro), com cada segmento como
+# (fim do segmento anterior, entradas do indice), ou None se a cadeia for invalida
+def _read_chain(f, end):
+    max_bits = None
+    segments = []
+    while end > 0:
+        segment = _read_segment(f, end)
+        if segment is None or (max_bits is not None and segment[0] != max_bits):
+            return None
+        max_bits, previous_end, entries = segment
+        segments.append((previous_end, entries))
+        end = previous_end
+    return max_bits, segments
+
+
+# encontra o fim do ultimo segmento valido do arquivo
+# normalmente e o proprio fim do arquivo; se uma escrita foi interrompida, o final do arquivo
+# nao tem um trailer valido e o arquivo e percorrido de tras para frente ate o trailer mais
+# proximo do fim cuja cadeia seja valida, descartando o segmento incompleto
+# retorna (fim, max_bits, segmentos); o fim e 0 e max_bits e None se nao houver segmento valido
+def _find_end(f, size):
+    chain = _read_chain(f, size)
+    if chain is not None:
+        return (size, *chain)
+    position = size
+    window = 1 << 16
+    while position > 0:
+        start = max(0, position - window)
+        f.seek(start)
+        data = f.read(position - start + len(MAGIC) - 1)
+        # so interessam as ocorrencias que comecam antes de position; as demais ja foram testadas
+        limit = position - start + len(MAGIC) - 1
+        while (index := data.rfind(MAGIC, 0, limit)) != -1:
+            end = start + index + TRAILER.size
+            if end <= size:
+                chain = _read_chain(f, end)
+                if chain is not None:
+                    return (end, *chain)
+            limit = index + len(MAGIC) - 1
+        position = start
+    return 0, None, []
+
+
+# converte os segmentos de uma cadeia na lista de blocos, em ordem
+def _blocks(segments):
+    blocks = []
+    for previous_end, entries in reversed(segments):
+        offset = previous_end
+        for code_count, raw_length in entries:
+            blocks.append((offset, code_count, raw_length))
+            offset += code_count * 2
+    return blocks
+
+
+# retorna a lista de blocos do arquivo, em ordem: (posicao, numero de codigos, tamanho original)
+# apenas os indices e trailers sao lidos; um segmento final incompleto e ignorado
+def read_index(input_path):
+    with open(input_path, 'rb') as f:
+        _, _, segments = _find_end(f, os.path.getsize(input_path))
+    return _blocks(segments)
+
+
+# acrescenta data ao final do arquivo como um novo segmento, criando o arquivo se ele nao existir
+# sem max_bits, usa o do arquivo existente (ou 12 para um arquivo novo)
+# o custo depende apenas do tamanho de data: so o trailer e o indice do ultimo segmento sao lidos
+# o segmento e escrito a partir do fim do ultimo segmento valido, descartando restos de uma escrita
+# interrompida, e o trailer so e gravado depois que blocos e indice chegaram ao disco: se a escrita
+# for interrompida, o arquivo continua legivel ate o segmento anterior
+# retorna o numero de blocos escritos
+def append(output_path, data, max_bits=None, block_size=256 * 1024):
+    if max_bits is not None and max_bits > 16:
+        raise ValueError("max_bits deve ser no maximo 16")
+    if not data:
+        return 0
+    mode = 'r+b' if os.path.isfile(output_path) else 'w+b'
+    with open(output_path, mode) as f:
+        size = f.seek(0, os.SEEK_END)
+        # normalmente basta validar o trailer e o indice no fim do arquivo; a cadeia inteira so e
+        # percorrida para recuperar o arquivo depois de uma escrita interrompida
+        segment = _read_segment(f, size)
+        if segment is not None:
+            previous_end, file_bits = size, segment[0]
+        else:
+            previous_end, file_bits, _ = _find_end(f, size)
+        if size > 0 and file_bits is None:
+            raise ValueError("Arquivo incremental invalido")
+        if file_bits is not None:
+            if max_bits is not None and file_bits != max_bits:
+                raise ValueError(f"O arquivo usa max_bits={file_bits}, diferente de {max_bits}")
+            max_bits = file_bits
+        elif max_bits is None:
+            max_bits = 12
+
+        entries = []
+        f.seek(previous_end)
+        f.truncate()
+        for start in range(0, len(data), block_size):
+            block = data[start:start + block_size]
+            codes = compress_segment((block, "", max_bits))
+            f.write(struct.pack(f'>{len(codes)}H', *codes))
+            entries.append((len(codes), len(block)))
+        for entry in entries:
+            f.write(INDEX_ENTRY.pack(*entry))
+        f.flush()
+        os.fsync(f.fileno())
+        f.write(TRAILER.pack(MAGIC, max_bits, len(entries), previous_end))
+        f.flush()
+        os.fsync(f.fileno())
+    return len(entries)
+
+
+# gera o texto de cada bloco, em ordem, lendo apenas um bloco por vez
+def decompress_iter(input_path):
+    with open(input_path, 'rb') as f:
+        _, max_bits, segments = _find_end(f, os.path.getsize(input_path))
+        for offset, code_count, _ in _blocks(segments):
+            f.seek(offset)
+            codes = list(struct.unpack(f'>{code_count}H', f.read(code_count * 2)))
+            yield decompress_segment((codes, "", max_bits))
+
+
+def main():
+
+    # recebe os argumentos de entrada para a execucao do codigo
+    parser = argparse.ArgumentParser(description="Appendable LZW archive")
+    parser.add_argument("operation", choices=["compress", "append", "decompress"], help="Operation to perform")
+    parser.add_argument("input_file", type=str, help="Path to input file")
+    parser.add_argument("output_file", type=str, help="Path to output file (the archive, for compress/append)")
+    parser.add_argument("--max_bits", type=int, default=None,
+                        help="Maximum number of bits (default: the archive's, or 12 for a new archive)")
+    parser.add_argument("--block_size", type=int, default=256 * 1024, help="Block size in bytes (default: 262144)")
+
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.input_file):
+        print(f"Error: File '{args.input_file}' does not exist.")
+        return 1
+
+    if args.operation in ("compress", "append"):
+        with open(args.input_file, 'rb') as f:
+            input_data = f.read().decode('latin1')
+
+        # compress recria o arquivo; append acrescenta um novo segmento
+        if args.operation == "compress" and os.path.isfile(args.output_file):
+            os.remove(args.output_file)
+        block_count = append(args.output_file, input_data, args.max_bits, args.block_size)
+        print(f"{block_count} blocos acrescentados em: {args.output_file}")
+
+    elif args.operation == "decompress":
+        with open(args.output_file, 'w', encoding="latin1") as f:
+            for chunk in decompress_iter(args.input_file):
+                f.write(chunk)
+        print(f"Arquivo descomprimido salvo em: {args.output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import argparse
+import math
+import os
+from collections import Counter
+
+from .lzw import LZWCompressor, LZWDecompressor
+from .dynamic import LZWCompressorDynamic, LZWDecompressorDynamic
+
+# metodos registrados no cabecalho do arquivo de saida
+METHOD_RAW = 0
+METHOD_STATIC = 1
+METHOD_DYNAMIC = 2
+
+# configuracao do codec padrao (lzw.py) e a alternativa com dicionario maior
+# as variantes estatica e dinamica geram a mesma sequencia de codigos para o mesmo max_bits, entao
+# so a dinamica, mais rapida, e usada; de 9 a 16 bits todo codigo ocupa 2 bytes
+DEFAULT = (METHOD_DYNAMIC, 12)
+WIDE = (METHOD_DYNAMIC, 16)
+
+SAMPLE_COUNT = 4  # numero de janelas amostradas
+SAMPLE_SIZE = 4096  # tamanho de cada janela em caracteres
+RAW_ENTROPY = 7.5  # acima dessa entropia (bits por caractere) a entrada e guardada sem compressao
+FILL_WINDOW = 4096  # caracteres comprimidos entre verificacoes do dicionario cheio
+
+
+# calcula a entropia de shannon em bits por caractere
+# complexidade O(n), onde n e o tamanho do texto
+def calculate_entropy(text):
+    if not text:
+        return 0.0
+    total = len(text)
+    return -sum(count / total * math.log2(count / total) for count in Counter(text).values())
+
+
+# seleciona janelas espalhadas pela entrada; entradas pequenas sao usadas inteiras
+def sample_windows(input_data, count=SAMPLE_COUNT, size=SAMPLE_SIZE):
+    if len(input_data) <= count * size:
+        return [input_data]
+    step = (len(input_data) - size) // (count - 1)
+    return [input_data[i * step:i * step + size] for i in range(count)]
+
+
+# tamanho em bytes de cada codigo no arquivo de saida
+def code_size(max_bits):
+    return (max_bits + 7) // 8
+
+
+def _compress(method, max_bits, input_data):
+    if method == METHOD_STATIC:
+        return LZWCompressor(max_bits=max_bits).compress(input_data)
+    compressed_data, _ = LZWCompressorDynamic(max_bits=max_bits).compress(input_data)
+    return compressed_data
+
+
+def _decompress(method, max_bits, compressed_data):
+    if not compressed_data:
+        return ""
+    if method == METHOD_STATIC:
+        return LZWDecompressor(max_bits=max_bits).decompress(compressed_data)
+    return LZWDecompressorDynamic(max_bits=max_bits).decompress(compressed_data)
+
+
+# decide pelas amostras se a entrada deve ser guardada sem compressao
+# so a entropia e usada: uma amostra curta comprimida com um dicionario vazio nao indica a taxa real
+def is_incompressible(input_data):
+    samples = sample_windows(input_data)
+    if not any(samples):
+        return True
+    return max(calculate_entropy(sample) for sample in samples) > RAW_ENTROPY
+
+
+# comprime com a variante dinamica e retorna (codigos, posicao da entrada em que o dicionario
+# encheu, ou None se ele nao encheu)
+def _compress_tracking_fill(input_data, max_bits):
+    compressor = LZWCompressorDynamic(max_bits=max_bits)
+    max_code = (1 << max_bits) - 1
+    result = []
+    filled_at = None
+    position = 0
+    for codes in compressor.compress_iter(input_data, chunk_size=FILL_WINDOW):
+        result.extend(codes)
+        position = min(position + FILL_WINDOW, len(input_data))
+        if filled_at is None and compressor.next_code > max_code:
+            filled_at = position
+    return result, filled_at
+
+
+def _encode(method, max_bits, compressed_data):
+    size = code_size(max_bits)
+    return bytes([method, max_bits]) + b''.join(code.to_bytes(size, byteorder='big') for code in compressed_data)
+
+
+# comprime escolhendo os parametros automaticamente e retorna o conteudo do arquivo
+# o cabecalho guarda o metodo e o max_bits escolhidos (1 byte cada)
+# a entrada e sempre comprimida com o codec padrao, e a menor entre essa saida e os dados sem
+# compressao e mantida; enquanto o dicionario de 12 bits nao enche, um dicionario maior gera os
+# mesmos codigos, entao a entrada so e comprimida uma segunda vez, com 16 bits, se o dicionario
+# padrao encheu antes do fim da entrada
+def compress(input_data):
+    output = bytes([METHOD_RAW, 0]) + input_data.encode('latin1')
+    if is_incompressible(input_data):
+        return output
+    compressed_data, filled_at = _compress_tracking_fill(input_data, DEFAULT[1])
+    output = min(output, _encode(*DEFAULT, compressed_data), key=len)
+    if filled_at is not None and filled_at < len(input_data):
+        output = min(output, _encode(*WIDE, _compress(*WIDE, input_data)), key=len)
+    return output
+
+
+# le o cabecalho e descomprime com o metodo registrado nele
+def decompress(data):
+    method, max_bits = data[0], data[1]
+    payload = data[2:]
+    if method == METHOD_RAW:
+        return payload.decode('latin1')
+    if method not in (METHOD_STATIC, METHOD_DYNAMIC):
+        raise ValueError(f"Metodo desconhecido no cabecalho: {method}")
+    size = code_size(max_bits)
+    if len(payload) % size:
+        raise ValueError("Arquivo comprimido truncado: termina no meio de um codigo")
+    compressed_data = [int.from_bytes(payload[i:i + size], byteorder='big') for i in range(0, len(payload), size)]
+    return _decompress(method, max_bits, compressed_data)
+
+
+def main():
+
+    # recebe os argumentos de entrada para a execucao do codigo
+    parser = argparse.ArgumentParser(description="LZW Compression/Decompression Tool with automatic parameter selection")
+    parser.add_argument("operation", choices=["compress", "decompress"], help="Operation to perform")
+    parser.add_argument("input_file", type=str, help="Path to input file")
+    parser.add_argument("output_file", type=str, help="Path to output file")
+
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.input_file):
+        print(f"Error: File '{args.input_file}' does not exist.")
+        return 1
+
+    if args.operation == "compress":
+        with open(args.input_file, 'rb') as f:
+            input_data = f.read().decode('latin1')
+
+        output = compress(input_data)
+        with open(args.output_file, 'wb') as f:
+            f.write(output)
+        print(f"Arquivo comprimido salvo em: {args.output_file} (metodo {output[0]}, max_bits {output[1]})")
+
+    elif args.operation == "decompress":
+        with open(args.input_file, 'rb') as f:
+            data = f.read()
+
+        decompressed_data = decompress(data)
+        with open(args.output_file, 'w', encoding="latin1") as f:
+            f.write(decompressed_data)
+        print(f"Arquivo descomprimido salvo em: {args.output_file}")
+
+if __name__ == "__main__":
+    main()
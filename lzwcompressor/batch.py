@@ -0,0 +1,242 @@
+from multiprocessing import Pool, shared_memory
+import os
+import struct
+
+# cada codigo ocupa 2 bytes, no mesmo formato de write_compressed_file
+CODE_SIZE = 2
+
+# lotes menores que isso sao processados no proprio processo, sem pool
+MIN_PARALLEL_BYTES = 1 << 16
+
+# dicionarios iniciais montados uma unica vez e copiados para cada entrada, em vez de
+# reconstruir a trie de 256 nos de LZWCompressor a cada buffer; os codigos gerados sao os mesmos
+_INITIAL_CODES = {chr(i): i for i in range(256)}
+_INITIAL_STRINGS = [chr(i) for i in range(256)]
+
+# memorias compartilhadas abertas por cada worker do pool, pelo nome
+_worker_arenas = {}
+
+
+# comprime uma entrada com o mesmo algoritmo e os mesmos codigos de LZWCompressor
+def _compress_codes(input_data, max_code):
+    dictionary = _INITIAL_CODES.copy()
+    next_code = 256
+    result = []
+    current_string = ""
+    for char in input_data:
+        combined_string = current_string + char
+        if combined_string in dictionary:
+            current_string = combined_string
+        else:
+            result.append(dictionary[current_string])
+            if next_code <= max_code:
+                dictionary[combined_string] = next_code
+                next_code += 1
+            current_string = char
+    if current_string:
+        result.append(dictionary[current_string])
+    return result
+
+
+# descomprime uma entrada com o mesmo algoritmo de LZWDecompressor
+def _decompress_codes(compressed_data, max_code):
+    if not compressed_data:
+        return ""
+    dictionary = _INITIAL_STRINGS.copy()
+    current_string = dictionary[compressed_data[0]]
+    result = [current_string]
+    for code in compressed_data[1:]:
+        if code < len(dictionary):
+            entry = dictionary[code]
+        elif code == len(dictionary):
+            entry = current_string + current_string[0]
+        else:
+            raise ValueError("Invalid LZW code")
+        result.append(entry)
+        if len(dictionary) <= max_code:
+            dictionary.append(current_string + entry[0])
+        current_string = entry
+    return ''.join(result)
+
+
+# retorna a memoria compartilhada com esse nome, anexando o worker a ela na primeira vez
+# arenas substituidas pelo processo principal (ao crescerem) sao fechadas
+def _attach(*names):
+    for name in list(_worker_arenas):
+        if name not in names:
+            _worker_arenas.pop(name).close()
+    for name in names:
+        if name not in _worker_arenas:
+            _worker_arenas[name] = shared_memory.SharedMemory(name=name)
+    return [_worker_arenas[name].buf for name in names]
+
+
+# comprime um intervalo de entradas lendo e escrevendo diretamente nas arenas
+# retorna o numero de codigos gerados por entrada
+def _compress_job(job):
+    input_name, output_name, offsets, max_bits = job
+    input_buf, output_buf = _attach(input_name, output_name)
+    max_code = (1 << max_bits) - 1
+    counts = []
+    for start, end in offsets:
+        codes = _compress_codes(bytes(input_buf[start:end]).decode('latin1'), max_code)
+        struct.pack_into(f'>{len(codes)}H', output_buf, start * CODE_SIZE, *codes)
+        counts.append(len(codes))
+    return counts
+
+
+# descomprime um intervalo de entradas lidas da arena de codigos
+def _decompress_slice(input_buf, offsets, max_bits):
+    max_code = (1 << max_bits) - 1
+    return [_decompress_codes(struct.unpack_from(f'>{(end - start) // CODE_SIZE}H', input_buf, start), max_code)
+            for start, end in offsets]
+
+
+def _decompress_job(job):
+    input_name, offsets, max_bits = job
+    input_buf, = _attach(input_name)
+    return _decompress_slice(input_buf, offsets, max_bits)
+
+
+# divide a tabela de offsets em lotes de tamanho parecido, um conjunto por tarefa do pool
+def _split_jobs(offsets, workers):
+    total = sum(end - start for start, end in offsets)
+    target = max(1, total // (workers * 4))
+    jobs = []
+    current = []
+    current_size = 0
+    for start, end in offsets:
+        current.append((start, end))
+        current_size += end - start
+        if current_size >= target:
+            jobs.append(current)
+            current = []
+            current_size = 0
+    if current:
+        jobs.append(current)
+    return jobs
+
+
+class BatchCompressor:
+    # compressor de lotes reutilizavel: o pool de workers e as arenas em memoria compartilhada
+    # sao criados na primeira chamada paralela e mantidos entre as chamadas seguintes
+    # as arenas so sao recriadas quando um lote nao cabe nelas
+    # use com `with` ou chame close() ao terminar
+    def __init__(self, max_bits=12, workers=None):
+        if max_bits > CODE_SIZE * 8:
+            raise ValueError(f"max_bits deve ser no maximo {CODE_SIZE * 8}")
+        self.max_bits = max_bits
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self._pool = None
+        self._input = None
+        self._output = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # encerra o pool e libera as arenas
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        for arena in (self._input, self._output):
+            if arena is not None:
+                arena.close()
+                arena.unlink()
+        self._input = None
+        self._output = None
+
+    def _parallel(self, total):
+        return self.workers > 1 and total >= MIN_PARALLEL_BYTES
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = Pool(self.workers)
+        return self._pool
+
+    # retorna uma arena de pelo menos size bytes, substituindo arena se ela for pequena demais
+    # a nova arena tem folga para que lotes um pouco maiores nao a recriem
+    @staticmethod
+    def _grow(arena, size):
+        if arena is None:
+            return shared_memory.SharedMemory(create=True, size=max(size, 4096))
+        if arena.size >= size:
+            return arena
+        new_size = max(size, 2 * arena.size)
+        arena.close()
+        arena.unlink()
+        return shared_memory.SharedMemory(create=True, size=new_size)
+
+    # comprime varios buffers de uma vez
+    # retorna (saida, offsets): a saida e um unico buffer contiguo com os codigos de todas as
+    # entradas e offsets[i] = (inicio, fim) delimita os codigos da entrada i
+    # complexidade O(n.m), como em LZWCompressor.compress, sobre o total n de caracteres
+    def compress_many(self, buffers):
+        data = [b.encode('latin1') if isinstance(b, str) else bytes(b) for b in buffers]
+        offsets = []
+        total = 0
+        for item in data:
+            offsets.append((total, total + len(item)))
+            total += len(item)
+        max_code = (1 << self.max_bits) - 1
+
+        if not self._parallel(total):
+            output = []
+            output_offsets = []
+            position = 0
+            for item in data:
+                codes = _compress_codes(item.decode('latin1'), max_code)
+                output.append(struct.pack(f'>{len(codes)}H', *codes))
+                output_offsets.append((position, position + len(codes) * CODE_SIZE))
+                position += len(codes) * CODE_SIZE
+            return b''.join(output), output_offsets
+
+        # as entradas sao copiadas uma unica vez para a arena de entrada; cada caractere gera
+        # no maximo um codigo, entao os codigos da entrada i cabem a partir de inicio * CODE_SIZE
+        self._input = self._grow(self._input, total)
+        self._output = self._grow(self._output, total * CODE_SIZE)
+        for item, (start, end) in zip(data, offsets):
+            self._input.buf[start:end] = item
+        del data
+
+        jobs = [(self._input.name, self._output.name, job, self.max_bits)
+                for job in _split_jobs(offsets, self.workers)]
+        counts = [count for job_counts in self._get_pool().map(_compress_job, jobs) for count in job_counts]
+
+        # compacta as fatias de cada entrada em um buffer contiguo
+        output = bytearray(sum(counts) * CODE_SIZE)
+        output_offsets = []
+        position = 0
+        for (start, _), count in zip(offsets, counts):
+            size = count * CODE_SIZE
+            output[position:position + size] = self._output.buf[start * CODE_SIZE:start * CODE_SIZE + size]
+            output_offsets.append((position, position + size))
+            position += size
+        return bytes(output), output_offsets
+
+    # operacao inversa de compress_many: recebe o buffer contiguo de codigos e a tabela de offsets
+    # e retorna a lista de textos descomprimidos, na mesma ordem
+    def decompress_many(self, data, offsets):
+        offsets = list(offsets)
+        if not self._parallel(len(data)):
+            return _decompress_slice(data, offsets, self.max_bits)
+
+        self._input = self._grow(self._input, len(data))
+        self._input.buf[:len(data)] = data
+        jobs = [(self._input.name, job, self.max_bits) for job in _split_jobs(offsets, self.workers)]
+        return [text for job_result in self._get_pool().map(_decompress_job, jobs) for text in job_result]
+
+
+# atalhos para um unico lote; para varios lotes, reutilize um BatchCompressor
+def compress_many(buffers, max_bits=12, workers=None):
+    with BatchCompressor(max_bits, workers) as batch:
+        return batch.compress_many(buffers)
+
+
+def decompress_many(data, offsets, max_bits=12, workers=None):
+    with BatchCompressor(max_bits, workers) as batch:
+        return batch.decompress_many(data, offsets)
@@ -0,0 +1,179 @@
+import argparse
+import csv
+import os
+import random
+import signal
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from .cases import calculate_shannon_entropy, fields, generators
+from .dynamic import LZWCompressorDynamic
+from .lzw import LZWCompressor
+
+# arquivo de resultados de cada variante, os mesmos lidos pelo app
+OUTPUT_FILES = {
+    "static": "lzw_analysis.csv",
+    "dynamic": "lzw_dynamic_analysis.csv",
+}
+
+
+class JobTimeout(Exception):
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise JobTimeout()
+
+
+# gera, comprime e mede um caso de teste; executado nos workers do pool
+# retorna (variante, linha do CSV) ou (variante, None) se o caso exceder o tempo limite
+def run_job(job):
+    iteration, level, length, variant, max_bits, timeout, seed = job
+
+    # cada caso usa sua propria semente, ja que os workers herdam o mesmo estado do gerador
+    np.random.seed(seed)
+    random.seed(seed)
+
+    # o limite de tempo interrompe casos patologicos sem travar o restante da varredura
+    use_alarm = timeout and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.alarm(timeout)
+    try:
+        input_string = generators[level - 1](length)
+        entropy = calculate_shannon_entropy(input_string)
+
+        if variant == "dynamic":
+            compressor = LZWCompressorDynamic(max_bits=max_bits)
+            start_time = time.time()
+            compressed_data, final_bits = compressor.compress(input_string)
+            compression_time = time.time() - start_time
+            dictionary_size = compressor.next_code
+            code_bits = final_bits
+            output_bytes = 1 + len(compressed_data) * ((final_bits + 7) // 8)
+        else:
+            compressor = LZWCompressor(max_bits=max_bits)
+            start_time = time.time()
+            compressed_data = compressor.compress(input_string)
+            compression_time = time.time() - start_time
+            dictionary_size = compressor.trie.next_code
+            code_bits = max_bits
+            output_bytes = len(compressed_data) * 2
+    except JobTimeout:
+        return variant, None
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+
+    compression_rate = len(compressed_data) * code_bits / (len(input_string) * 8)
+    return variant, [iteration, level, length, entropy, compression_time, compression_rate,
+                     dictionary_size, output_bytes]
+
+
+# abre o CSV de uma variante para acrescentar linhas, escrevendo o cabecalho se ele for novo
+# arquivos com um esquema antigo (prefixo de fields) sao convertidos, deixando vazias as colunas novas
+# retorna (arquivo, writer, ultima iteracao registrada)
+def open_results(output_file):
+    last_iteration = 0
+    if os.path.isfile(output_file) and os.path.getsize(output_file) > 0:
+        with open(output_file, newline="") as file:
+            reader = csv.reader(file)
+            header = next(reader)
+            rows = [row for row in reader if row]
+        if header != fields:
+            if header != fields[:len(header)]:
+                raise ValueError(f"O cabecalho de '{output_file}' difere de {fields}")
+            with open(output_file, mode="w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(fields)
+                writer.writerows(row + [""] * (len(fields) - len(header)) for row in rows)
+        if rows:
+            last_iteration = int(rows[-1][0])
+        file = open(output_file, mode="a", newline="")
+        return file, csv.writer(file), last_iteration
+    file = open(output_file, mode="w", newline="")
+    writer = csv.writer(file)
+    writer.writerow(fields)
+    return file, writer, last_iteration
+
+
+def main():
+
+    # recebe os argumentos de entrada para a execucao do codigo
+    parser = argparse.ArgumentParser(description="Parallel LZW benchmark runner")
+    parser.add_argument("--variants", nargs="+", choices=sorted(OUTPUT_FILES), default=["static", "dynamic"],
+                        help="Variants to benchmark (default: both)")
+    parser.add_argument("--levels", nargs="+", type=int, default=list(range(1, len(generators) + 1)),
+                        help="Entropy levels to benchmark (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000, 1000000],
+                        help="Input sizes to benchmark")
+    parser.add_argument("--repeat", type=int, default=1, help="Repetitions of each (level, size, variant) job")
+    parser.add_argument("--max_bits", type=int, default=12, help="Maximum number of bits (default: 12)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument("--timeout", type=int, default=600, help="Per-job timeout in seconds (0 disables it)")
+    parser.add_argument("--batch_size", type=int, default=32, help="Rows buffered before each write")
+    parser.add_argument("--seed", type=int, default=None, help="Base random seed")
+
+    args = parser.parse_args()
+
+    for level in args.levels:
+        if not 1 <= level <= len(generators):
+            print(f"Error: entropy level {level} must be between 1 and {len(generators)}.")
+            return 1
+
+    outputs = {variant: open_results(OUTPUT_FILES[variant]) for variant in args.variants}
+    iterations = {variant: output[2] for variant, output in outputs.items()}
+    buffers = {variant: [] for variant in args.variants}
+    base_seed = args.seed if args.seed is not None else random.SystemRandom().randrange(2 ** 32)
+
+    jobs = []
+    for _ in range(args.repeat):
+        for level in args.levels:
+            for length in args.sizes:
+                for variant in args.variants:
+                    iterations[variant] += 1
+                    seed = (base_seed + len(jobs)) % (2 ** 32)
+                    jobs.append((iterations[variant], level, length, variant, args.max_bits, args.timeout, seed))
+    # casos grandes primeiro, para que nao fiquem sozinhos no fim da varredura
+    jobs.sort(key=lambda job: job[2], reverse=True)
+
+    # grava as linhas acumuladas de uma variante de uma so vez
+    def flush(variant):
+        file, writer, _ = outputs[variant]
+        writer.writerows(sorted(buffers[variant]))
+        file.flush()
+        buffers[variant].clear()
+
+    done = 0
+    timeouts = 0
+    try:
+        with Pool(args.workers) as pool:
+            for variant, row in pool.imap_unordered(run_job, jobs):
+                done += 1
+                if row is None:
+                    timeouts += 1
+                    print(f"[{done}/{len(jobs)}] {variant}: caso excedeu {args.timeout}s e foi descartado")
+                    continue
+                buffers[variant].append(row)
+                print(f"[{done}/{len(jobs)}] {variant}: Nível {row[1]}, Tamanho {row[2]}, Entropia {row[3]:.4f}, "
+                      f"Tempo {row[4]:.4f}s, Taxa {row[5]:.4f}")
+                if len(buffers[variant]) >= args.batch_size:
+                    flush(variant)
+    except KeyboardInterrupt:
+        print("\nExecução interrompida pelo usuário.")
+    finally:
+        for variant in args.variants:
+            flush(variant)
+            outputs[variant][0].close()
+
+    print(f"{done - timeouts} casos salvos, {timeouts} descartados por tempo limite")
+
+    # atualiza o armazenamento colunar e os agregados usados pelo relatorio (pandas so e carregado aqui)
+    from .report_data import build_report_data
+    for variant in args.variants:
+        build_report_data(OUTPUT_FILES[variant])
+
+if __name__ == "__main__":
+    main()
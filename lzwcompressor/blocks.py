@@ -0,0 +1,202 @@
+import argparse
+import os
+import struct
+from multiprocessing import Pool
+
+# modo em blocos: a entrada e dividida em blocos comprimidos em paralelo, e o dicionario de cada
+# bloco e pre-carregado com o final (prime_size caracteres) do bloco anterior
+# para que a descompressao tambem seja paralela, o final de cada bloco e um segmento separado,
+# pre-carregado apenas com o final do bloco anterior: a descompressao primeiro percorre a cadeia
+# curta de finais e depois recupera todos os corpos em paralelo, cada um pre-carregado com o final
+# do bloco anterior
+
+MAGIC = b'LZWB'
+
+
+# executa o lzw sobre text apenas para aprender sequencias, sem gerar codigos
+# o compressor e o descompressor chamam esta mesma funcao, obtendo dicionarios identicos
+# complexidade O(p), onde p e o tamanho do texto de pre-carga
+def learn(text, trie, next_code, max_code):
+    current_string = ""
+    for char in text:
+        combined_string = current_string + char
+        if combined_string in trie:
+            current_string = combined_string
+        else:
+            if next_code <= max_code:
+                trie[combined_string] = next_code
+                next_code += 1
+            current_string = char
+    return next_code
+
+
+# comprime um segmento com o dicionario pre-carregado por prime
+def compress_segment(job):
+    input_data, prime, max_bits = job
+    max_code = (1 << max_bits) - 1
+    trie = {chr(i): i for i in range(256)}
+    next_code = learn(prime, trie, 256, max_code)
+
+    result = []
+    current_string = ""
+    for char in input_data:
+        combined_string = current_string + char
+        if combined_string in trie:
+            current_string = combined_string
+        else:
+            result.append(trie[current_string])
+            if next_code <= max_code:
+                trie[combined_string] = next_code
+                next_code += 1
+            current_string = char
+    if current_string:
+        result.append(trie[current_string])
+    return result
+
+
+# descomprime um segmento, repetindo a mesma pre-carga do compressor
+def decompress_segment(job):
+    compressed_data, prime, max_bits = job
+    if not compressed_data:
+        return ""
+    max_code = (1 << max_bits) - 1
+    trie = {chr(i): i for i in range(256)}
+    next_code = learn(prime, trie, 256, max_code)
+    dictionary = {code: string for string, code in trie.items()}
+
+    current_string = dictionary[compressed_data[0]]
+    result = [current_string]
+    for code in compressed_data[1:]:
+        if code in dictionary:
+            entry = dictionary[code]
+        elif code == next_code:
+            entry = current_string + current_string[0]
+        else:
+            raise ValueError("Invalid LZW code")
+        result.append(entry)
+        if next_code <= max_code:
+            dictionary[next_code] = current_string + entry[0]
+            next_code += 1
+        current_string = entry
+    return ''.join(result)
+
+
+def _map(function, jobs, workers):
+    if workers == 1 or len(jobs) < 2:
+        return [function(job) for job in jobs]
+    with Pool(workers) as pool:
+        return pool.map(function, jobs)
+
+
+# divide a entrada em blocos e cada bloco em (corpo, final)
+# o ultimo bloco nao precisa de final separado, pois nenhum outro bloco depende dele
+def split_blocks(input_data, block_size, prime_size):
+    blocks = []
+    starts = list(range(0, len(input_data), block_size))
+    for index, start in enumerate(starts):
+        block = input_data[start:start + block_size]
+        if index == len(starts) - 1 or prime_size == 0:
+            blocks.append((block, ""))
+        else:
+            cut = max(0, len(block) - prime_size)
+            blocks.append((block[:cut], block[cut:]))
+    return blocks
+
+
+# comprime em blocos e retorna o conteudo do arquivo
+# formato: cabecalho, tabela com o numero de codigos do corpo e do final de cada bloco, e os codigos
+def compress(input_data, max_bits=16, block_size=256 * 1024, prime_size=16 * 1024, workers=None):
+    if max_bits > 16:
+        raise ValueError("max_bits deve ser no maximo 16")
+    # com prime_size >= block_size todo o bloco viraria final e a descompressao seria uma unica cadeia sequencial
+    if not 0 <= prime_size < block_size:
+        raise ValueError("prime_size deve estar entre 0 e block_size - 1")
+    workers = workers or os.cpu_count() or 1
+    blocks = split_blocks(input_data, block_size, prime_size)
+
+    jobs = []
+    previous_tail = ""
+    for body, tail in blocks:
+        jobs.append((body, previous_tail, max_bits))
+        jobs.append((tail, previous_tail, max_bits))
+        previous_tail = tail
+    segments = _map(compress_segment, jobs, workers)
+
+    out = [MAGIC, struct.pack('>BII', max_bits, prime_size, len(blocks))]
+    out.append(b''.join(struct.pack('>II', len(segments[i]), len(segments[i + 1])) for i in range(0, len(segments), 2)))
+    for codes in segments:
+        out.append(struct.pack(f'>{len(codes)}H', *codes))
+    return b''.join(out)
+
+
+# descomprime em duas fases: primeiro a cadeia de finais, depois os corpos pre-carregados em paralelo
+def decompress(data, workers=None):
+    if data[:4] != MAGIC:
+        raise ValueError("Arquivo em blocos invalido")
+    workers = workers or os.cpu_count() or 1
+    max_bits, _, block_count = struct.unpack_from('>BII', data, 4)
+    offset = 13
+    counts = [struct.unpack_from('>II', data, offset + 8 * i) for i in range(block_count)]
+    offset += 8 * block_count
+
+    bodies, tails = [], []
+    for body_count, tail_count in counts:
+        bodies.append(list(struct.unpack_from(f'>{body_count}H', data, offset)))
+        offset += body_count * 2
+        tails.append(list(struct.unpack_from(f'>{tail_count}H', data, offset)))
+        offset += tail_count * 2
+
+    # os finais formam uma cadeia curta: cada um e pre-carregado com o final anterior
+    tail_texts = []
+    prime = ""
+    for codes in tails:
+        prime = decompress_segment((codes, prime, max_bits))
+        tail_texts.append(prime)
+    primes = [""] + tail_texts[:-1]
+    body_texts = _map(decompress_segment, [(codes, prime, max_bits) for codes, prime in zip(bodies, primes)], workers)
+    return ''.join(body + tail for body, tail in zip(body_texts, tail_texts))
+
+
+def main():
+
+    # recebe os argumentos de entrada para a execucao do codigo
+    parser = argparse.ArgumentParser(description="Parallel block LZW compression with primed dictionaries")
+    parser.add_argument("operation", choices=["compress", "decompress"], help="Operation to perform")
+    parser.add_argument("input_file", type=str, help="Path to input file")
+    parser.add_argument("output_file", type=str, help="Path to output file")
+    parser.add_argument("--max_bits", type=int, default=16, help="Maximum number of bits (default: 16)")
+    parser.add_argument("--block_size", type=int, default=256 * 1024, help="Block size in bytes (default: 262144)")
+    parser.add_argument("--prime_size", type=int, default=16 * 1024,
+                        help="Bytes of the previous block used to prime each dictionary, smaller than block_size (default: 16384)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.input_file):
+        print(f"Error: File '{args.input_file}' does not exist.")
+        return 1
+
+    if args.block_size <= 0 or not 0 <= args.prime_size < args.block_size:
+        print("Error: prime_size must be at least 0 and smaller than block_size.")
+        return 1
+
+    if args.operation == "compress":
+        with open(args.input_file, 'rb') as f:
+            input_data = f.read().decode('latin1')
+
+        output = compress(input_data, args.max_bits, args.block_size, args.prime_size, args.workers)
+        with open(args.output_file, 'wb') as f:
+            f.write(output)
+        print(f"Arquivo comprimido salvo em: {args.output_file}")
+
+    elif args.operation == "decompress":
+        with open(args.input_file, 'rb') as f:
+            data = f.read()
+
+        decompressed_data = decompress(data, args.workers)
+        with open(args.output_file, 'w', encoding="latin1") as f:
+            f.write(decompressed_data)
+        print(f"Arquivo descomprimido salvo em: {args.output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import csv
+import time
+import random
+from .cases import calculate_shannon_entropy, fields, generators
+from .dynamic import LZWCompressorDynamic
+
+# configuracao para salvar resultados no CSV
+output_file = "lzw_dynamic_analysis.csv"  # mesmas colunas de cases.py
+
+def main():
+    # inicializa o arquivo CSV
+    with open(output_file, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(fields)
+
+    # loop de geracao de casos e analise
+    iteration = 1
+    try:
+        while True:
+            # selecao do nivel de entropia e tamanho da string
+            level = random.randint(1, len(generators))
+            length = random.randint(100, 1000000)  # comprimento aleatorio entre 100 e 1.000.000
+            generator = generators[level - 1]
+        
+            # gera a string e calcula a entropia
+            input_string = generator(length)
+            entropy = calculate_shannon_entropy(input_string)
+
+            # compressão com LZW Dinamico
+            compressor = LZWCompressorDynamic(max_bits=12)  # ajuste de max_bits conforme necessario
+            start_time = time.time()
+            compressed_data, final_bits = compressor.compress(input_string)
+            end_time = time.time()
+            compression_time = end_time - start_time
+
+            # calcula a taxa de compressao
+            original_size = len(input_string) * 8  # tamanho original em bits
+            compressed_size = len(compressed_data) * final_bits  # tamanho comprimido com tamanho dinamico
+            compression_rate = compressed_size / original_size
+            dictionary_size = compressor.next_code  # numero de entradas no dicionario
+            output_bytes = 1 + len(compressed_data) * ((final_bits + 7) // 8)  # bytes gravados por write_compressed_file
+
+            # salva os resultados no CSV
+            with open(output_file, mode="a", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow([iteration, level, length, entropy, compression_time, compression_rate,
+                                 dictionary_size, output_bytes])
+
+            # exibe no terminal
+            print(f"Iteração {iteration}: Nível {level}, Tamanho {length}, Entropia {entropy:.4f}, "
+                  f"Tempo {compression_time:.4f}s, Taxa {compression_rate:.4f}")
+            iteration += 1
+
+    except KeyboardInterrupt:
+        print("\nExecução interrompida pelo usuário.")
+
+    # atualiza o armazenamento colunar e os agregados usados pelo relatorio
+    from .report_data import build_report_data
+    build_report_data(output_file)
+    print(f"Agregados do relatório salvos a partir de {output_file}")
+
+if __name__ == "__main__":
+    main()
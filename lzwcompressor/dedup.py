@@ -0,0 +1,372 @@
+import argparse
+import hashlib
+import io
+import os
+import random
+import struct
+
+from .lzw import LZWCompressor, LZWDecompressor
+
+# pre-etapa de deduplicacao: a entrada e dividida em blocos definidos pelo conteudo (rolling hash)
+# e cada bloco ja visto, em qualquer arquivo do arquivo compactado, vira apenas uma referencia
+# somente os blocos unicos passam pelo LZW
+# o arquivo compactado e um cabecalho seguido de segmentos, um por gravacao:
+#   cabecalho | segmento | segmento | ...
+#   segmento = codigos dos blocos novos | tabela de blocos | tabela de arquivos | trailer
+# a tabela de blocos guarda (impressao digital, numero de codigos) de cada bloco novo e a de
+# arquivos guarda o nome e as referencias de cada arquivo novo; os identificadores dos blocos
+# continuam a numeracao dos segmentos anteriores
+# o cabecalho guarda o fim do ultimo segmento completo e cada trailer guarda onde o segmento
+# anterior termina, formando uma cadeia que o leitor percorre a partir do cabecalho
+
+MAGIC = b'LZD3'  # formato atual, em segmentos
+OLD_MAGIC = b'LZD2'  # formato anterior: um bloco unico por arquivo compactado, sem segmentos
+LEGACY_MAGIC = b'LZWD'  # primeiro formato, sem impressoes digitais
+FINGERPRINT_SIZE = 16
+HEADER = struct.Struct('>4sBQ')  # magic, max_bits, fim do ultimo segmento completo
+TRAILER = struct.Struct('>IIQQ')  # blocos e arquivos do segmento, inicio das tabelas, fim do segmento anterior
+CHUNK_ENTRY = struct.Struct(f'>{FINGERPRINT_SIZE}sI')  # impressao digital, numero de codigos
+MIN_CHUNK = 2 * 1024  # tamanho minimo de um bloco em bytes
+AVG_CHUNK = 8 * 1024  # tamanho medio esperado (deve ser potencia de 2)
+MAX_CHUNK = 64 * 1024  # tamanho maximo de um bloco em bytes
+
+# tabela do gear hash, fixa para que os cortes sejam deterministicos entre execucoes
+_rng = random.Random(0x4C5A57)
+GEAR = [_rng.getrandbits(32) for _ in range(256)]
+del _rng
+
+
+# divide os dados em blocos cujas fronteiras dependem apenas do conteudo
+# um corte acontece quando os bits baixos do gear hash zeram, respeitando os tamanhos minimo e maximo
+# assim uma insercao no inicio do arquivo so altera os blocos vizinhos a ela
+# complexidade O(n), onde n e o tamanho dos dados
+def chunk_boundaries(data, min_size=MIN_CHUNK, avg_size=AVG_CHUNK, max_size=MAX_CHUNK):
+    mask = avg_size - 1
+    chunks = []
+    start = 0
+    length = len(data)
+    while start < length:
+        end = min(start + max_size, length)
+        h = 0
+        i = start + min_size
+        if i >= end:
+            chunks.append((start, end))
+            break
+        # o hash so depende dos ultimos 32 bytes, entao comeca um pouco antes do tamanho minimo
+        for byte in data[max(start, i - 32):i]:
+            h = ((h << 1) + GEAR[byte]) & 0xFFFFFFFF
+        cut = end
+        while i < end:
+            h = ((h << 1) + GEAR[data[i]]) & 0xFFFFFFFF
+            i += 1
+            if not h & mask:
+                cut = i
+                break
+        chunks.append((start, cut))
+        start = cut
+    return chunks
+
+
+# impressao digital de um bloco
+def fingerprint(chunk):
+    return hashlib.blake2b(chunk, digest_size=FINGERPRINT_SIZE).digest()
+
+
+class DedupArchive:
+
+    # inicializa um arquivo compactado vazio com o indice de blocos
+    def __init__(self, max_bits=12):
+        if max_bits > 16:
+            raise ValueError("max_bits deve ser no maximo 16")
+        self.max_bits = max_bits
+        self.index = {}  # impressao digital -> identificador do bloco
+        self.fingerprints = []  # impressao digital de cada bloco unico
+        self.chunks = []  # codigos LZW de cada bloco unico (None se nao foram carregados)
+        self.files = []  # (nome, lista de identificadores de blocos)
+        # arquivo de onde o arquivo compactado foi lido, o fim do seu ultimo segmento e quantos
+        # blocos e arquivos ja estao gravados nele; save acrescenta apenas o que vem depois
+        self.path = None
+        self.end = 0
+        self.saved_chunks = 0
+        self.saved_files = 0
+
+    # nome ainda nao usado no arquivo compactado; repeticoes recebem um sufixo numerico
+    def unique_name(self, name):
+        names = {existing for existing, _ in self.files}
+        candidate = name
+        suffix = 1
+        while candidate in names:
+            candidate = f"{name}.{suffix}"
+            suffix += 1
+        return candidate
+
+    # adiciona um arquivo: blocos ja conhecidos viram referencias, os novos sao comprimidos
+    # um nome repetido recebe um sufixo numerico (veja unique_name)
+    # retorna o numero de blocos novos
+    def add(self, name, data):
+        name = self.unique_name(name)
+        refs = []
+        new_chunks = 0
+        for start, end in chunk_boundaries(data):
+            chunk = data[start:end]
+            key = fingerprint(chunk)
+            chunk_id = self.index.get(key)
+            if chunk_id is None:
+                chunk_id = len(self.chunks)
+                self.index[key] = chunk_id
+                self.fingerprints.append(key)
+                self.chunks.append(LZWCompressor(max_bits=self.max_bits).compress(chunk.decode('latin1')))
+                new_chunks += 1
+            refs.append(chunk_id)
+        self.files.append((name, refs))
+        return new_chunks
+
+    # registra um bloco lido do arquivo compactado
+    def _add_chunk(self, key, codes):
+        self.index[key] = len(self.chunks)
+        self.fingerprints.append(key)
+        self.chunks.append(codes)
+
+    # descomprime os codigos de um bloco
+    def extract_chunk(self, codes):
+        return LZWDecompressor(max_bits=self.max_bits).decompress(codes).encode('latin1')
+
+    # reconstroi o conteudo de um arquivo a partir das referencias
+    def extract(self, refs):
+        cache = {}
+        parts = []
+        for chunk_id in refs:
+            if chunk_id not in cache:
+                cache[chunk_id] = self.extract_chunk(self.chunks[chunk_id])
+            parts.append(cache[chunk_id])
+        return b''.join(parts)
+
+    # serializa como um segmento que comeca na posicao start os blocos a partir de first_chunk
+    # e os arquivos a partir de first_file
+    def _segment(self, start, first_chunk, first_file):
+        chunks = self.chunks[first_chunk:]
+        out = [struct.pack(f'>{len(codes)}H', *codes) for codes in chunks]
+        table_start = start + sum(len(codes) * 2 for codes in chunks)
+        for key, codes in zip(self.fingerprints[first_chunk:], chunks):
+            out.append(CHUNK_ENTRY.pack(key, len(codes)))
+        files = self.files[first_file:]
+        for name, refs in files:
+            encoded = name.encode('utf-8')
+            out.append(struct.pack('>HI', len(encoded), len(refs)))
+            out.append(encoded)
+            out.append(struct.pack(f'>{len(refs)}I', *refs))
+        out.append(TRAILER.pack(len(chunks), len(files), table_start, start))
+        return b''.join(out)
+
+    # serializa o arquivo compactado inteiro, com um unico segmento
+    def to_bytes(self):
+        segment = self._segment(HEADER.size, 0, 0)
+        return HEADER.pack(MAGIC, self.max_bits, HEADER.size + len(segment)) + segment
+
+    # grava o arquivo compactado em path
+    # se ele foi lido de path, os blocos e arquivos novos sao acrescentados como um novo segmento
+    # e o custo depende apenas deles; o fim no cabecalho so e atualizado depois que o segmento
+    # chegou ao disco, entao uma gravacao interrompida deixa o arquivo com o conteudo anterior
+    # nos demais casos o arquivo e reescrito em um arquivo temporario trocado pelo original
+    def save(self, path):
+        if path == self.path and self.end:
+            if self.saved_chunks == len(self.chunks) and self.saved_files == len(self.files):
+                return
+            with open(path, 'r+b') as f:
+                segment = self._segment(self.end, self.saved_chunks, self.saved_files)
+                f.seek(self.end)
+                f.truncate()
+                f.write(segment)
+                f.flush()
+                os.fsync(f.fileno())
+                self.end += len(segment)
+                f.seek(0)
+                f.write(HEADER.pack(MAGIC, self.max_bits, self.end))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            data = self.to_bytes()
+            temp_path = path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            self.path = path
+            self.end = len(data)
+        self.saved_chunks = len(self.chunks)
+        self.saved_files = len(self.files)
+
+    # le um arquivo compactado de path
+    # sem load_codes, apenas as tabelas de blocos e de arquivos sao lidas: o indice de blocos fica
+    # completo para que novos arquivos sejam deduplicados contra os blocos existentes, mas os
+    # codigos nao sao carregados; os formatos anteriores sao sempre lidos inteiros
+    @classmethod
+    def load(cls, path, load_codes=True):
+        with open(path, 'rb') as f:
+            if f.read(4) != MAGIC:
+                f.seek(0)
+                return cls.from_bytes(f.read())
+            f.seek(0)
+            archive = cls._read(f, load_codes)
+        archive.path = path
+        return archive
+
+    # le um arquivo compactado a partir da memoria, em qualquer formato
+    # no formato LZWD as impressoes digitais sao recalculadas descomprimindo cada bloco
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] == MAGIC:
+            return cls._read(io.BytesIO(data))
+        if data[:4] not in (OLD_MAGIC, LEGACY_MAGIC):
+            raise ValueError("Arquivo deduplicado invalido")
+        legacy = data[:4] == LEGACY_MAGIC
+        max_bits, chunk_count = struct.unpack_from('>BI', data, 4)
+        archive = cls(max_bits=max_bits)
+        offset = 9
+        for _ in range(chunk_count):
+            if not legacy:
+                key = data[offset:offset + FINGERPRINT_SIZE]
+                offset += FINGERPRINT_SIZE
+            (count,) = struct.unpack_from('>I', data, offset)
+            offset += 4
+            codes = list(struct.unpack_from(f'>{count}H', data, offset))
+            offset += count * 2
+            if legacy:
+                key = fingerprint(archive.extract_chunk(codes))
+            archive._add_chunk(key, codes)
+        (file_count,) = struct.unpack_from('>I', data, offset)
+        archive._read_files(data, offset + 4, file_count)
+        return archive
+
+    # le file_count entradas da tabela de arquivos a partir de offset
+    def _read_files(self, data, offset, file_count):
+        for _ in range(file_count):
+            name_size, ref_count = struct.unpack_from('>HI', data, offset)
+            offset += 6
+            name = data[offset:offset + name_size].decode('utf-8')
+            offset += name_size
+            refs = list(struct.unpack_from(f'>{ref_count}I', data, offset))
+            offset += ref_count * 4
+            self.files.append((name, refs))
+
+    # le o formato em segmentos: percorre a cadeia a partir do fim gravado no cabecalho,
+    # validando cada trailer, e depois le os segmentos do primeiro ao ultimo
+    @classmethod
+    def _read(cls, f, load_codes=True):
+        _, max_bits, end = HEADER.unpack(f.read(HEADER.size))
+        archive = cls(max_bits=max_bits)
+        archive.end = end
+        segments = []
+        while end != HEADER.size:
+            if end < HEADER.size + TRAILER.size:
+                raise ValueError("Arquivo deduplicado invalido")
+            f.seek(end - TRAILER.size)
+            chunk_count, file_count, table_start, previous_end = TRAILER.unpack(f.read(TRAILER.size))
+            if not HEADER.size <= previous_end <= table_start <= end - TRAILER.size - chunk_count * CHUNK_ENTRY.size:
+                raise ValueError("Arquivo deduplicado invalido")
+            f.seek(table_start)
+            tables = f.read(end - TRAILER.size - table_start)
+            segments.append((previous_end, table_start, chunk_count, file_count, tables))
+            end = previous_end
+        for previous_end, table_start, chunk_count, file_count, tables in reversed(segments):
+            entries = list(CHUNK_ENTRY.iter_unpack(tables[:chunk_count * CHUNK_ENTRY.size]))
+            # os codigos dos blocos precisam ocupar exatamente o espaco antes das tabelas
+            if previous_end + sum(count * 2 for _, count in entries) != table_start:
+                raise ValueError("Arquivo deduplicado invalido")
+            if load_codes:
+                f.seek(previous_end)
+                data = f.read(table_start - previous_end)
+            offset = 0
+            for key, count in entries:
+                codes = list(struct.unpack_from(f'>{count}H', data, offset)) if load_codes else None
+                offset += count * 2
+                archive._add_chunk(key, codes)
+            archive._read_files(tables, chunk_count * CHUNK_ENTRY.size, file_count)
+        archive.saved_chunks = len(archive.chunks)
+        archive.saved_files = len(archive.files)
+        return archive
+
+
+# nome guardado para um arquivo de entrada: o caminho relativo ao diretorio atual, com '/'
+# arquivos fora do diretorio atual sao guardados apenas pelo nome base
+def archive_name(path):
+    name = os.path.relpath(path)
+    if os.path.isabs(name) or name.split(os.sep)[0] == os.pardir:
+        name = os.path.basename(path)
+    return name.replace(os.sep, '/')
+
+
+# caminho de extracao de name dentro de output_dir
+# nomes absolutos, com '..' ou que escapariam do diretorio (por links simbolicos) sao rejeitados
+def extraction_path(output_dir, name):
+    parts = name.split('/')
+    if not name or name.startswith('/') or os.path.isabs(name) or any(part in ('', '.', '..') for part in parts):
+        raise ValueError(f"Nome de arquivo inseguro no arquivo compactado: {name!r}")
+    root = os.path.realpath(output_dir)
+    path = os.path.realpath(os.path.join(root, *parts))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f"Nome de arquivo inseguro no arquivo compactado: {name!r}")
+    return path
+
+
+def main():
+
+    # recebe os argumentos de entrada para a execucao do codigo
+    parser = argparse.ArgumentParser(description="LZW compression with content-defined chunking and cross-file deduplication")
+    parser.add_argument("operation", choices=["compress", "add", "decompress"],
+                        help="Operation to perform (add appends files to an existing archive)")
+    parser.add_argument("archive", type=str, help="Path to the deduplicated archive")
+    parser.add_argument("paths", nargs="+", help="Input files (compress/add) or output directory (decompress)")
+    parser.add_argument("--max_bits", type=int, default=12,
+                        help="Maximum number of bits for a new archive (default: 12)")
+
+    args = parser.parse_args()
+
+    if args.max_bits > 16:
+        print("Error: max_bits must be at most 16.")
+        return 1
+
+    if args.operation in ("compress", "add"):
+        for path in args.paths:
+            if not os.path.isfile(path):
+                print(f"Error: File '{path}' does not exist.")
+                return 1
+
+        # add reabre o arquivo compactado existente, lendo apenas o indice de blocos e a tabela de
+        # arquivos, e acrescenta os arquivos novos ao final dele
+        if args.operation == "add" and os.path.isfile(args.archive):
+            archive = DedupArchive.load(args.archive, load_codes=False)
+        else:
+            archive = DedupArchive(max_bits=args.max_bits)
+
+        for path in args.paths:
+            with open(path, 'rb') as f:
+                data = f.read()
+            new_chunks = archive.add(archive_name(path), data)
+            name, refs = archive.files[-1]
+            print(f"{path} -> {name}: {new_chunks} blocos novos de {len(refs)}")
+
+        archive.save(args.archive)
+        print(f"Arquivo comprimido salvo em: {args.archive}")
+
+    elif args.operation == "decompress":
+        if not os.path.isfile(args.archive):
+            print(f"Error: File '{args.archive}' does not exist.")
+            return 1
+        archive = DedupArchive.load(args.archive)
+
+        output_dir = args.paths[0]
+        os.makedirs(output_dir, exist_ok=True)
+        # todos os nomes sao validados antes que qualquer arquivo seja escrito
+        try:
+            paths = [extraction_path(output_dir, name) for name, _ in archive.files]
+        except ValueError as error:
+            print(f"Error: {error}")
+            return 1
+        for path, (_, refs) in zip(paths, archive.files):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(archive.extract(refs))
+        print(f"Arquivos descomprimidos salvos em: {output_dir}")
+
+if __name__ == "__main__":
+    main()
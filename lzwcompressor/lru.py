@@ -0,0 +1,239 @@
+import argparse
+import os
+from collections import OrderedDict
+
+# custo em memoria de cada entrada aprendida, medido com tracemalloc no CPython 64 bits:
+# o crescimento real do dicionario ficou abaixo do orcamento de 16 KiB a 20 MiB
+# as constantes fazem parte do formato: o descompressor precisa remover as mesmas entradas,
+# entao o custo nao pode depender do interpretador que esta executando
+ENTRY_OVERHEAD = 312  # posicoes em strings, parent e children, entradas em codes e recency, o int do codigo e a folga das tabelas
+STRING_OVERHEAD = 73  # cabecalho de um str com caracteres latin1 (sys.getsizeof('\xff') - 1)
+BASE_OVERHEAD = 16 * 1024  # crescimento inicial das tabelas, que ja contem as 256 entradas ascii
+
+
+# custo de uma entrada aprendida de comprimento length
+def entry_cost(length):
+    return length + STRING_OVERHEAD + ENTRY_OVERHEAD
+
+
+class LRUDictionary:
+    # dicionario lzw com orcamento de memoria: quando nao ha codigo livre ou o orcamento acabaria,
+    # a folha usada ha mais tempo e removida e seu codigo e reaproveitado
+    # compressor e descompressor usam esta mesma classe, na mesma ordem de operacoes,
+    # para que as remocoes sejam identicas nos dois lados
+    def __init__(self, max_bits=16, memory_budget=1 << 20):
+        self.max_code = (1 << max_bits) - 1
+        self.memory_budget = memory_budget  # limite em bytes para o crescimento do dicionario
+        self.memory_used = BASE_OVERHEAD
+        # listas indexadas pelo codigo: os codigos liberados sao reaproveitados, entao elas so
+        # crescem ate o maior numero de entradas vivas ao mesmo tempo, ao contrario de mapas
+        # que acumulam espaco com as remocoes
+        self.strings = [chr(i) for i in range(256)]  # codigo -> sequencia (None se removida)
+        self.parent = [None] * 256  # codigo -> codigo do prefixo
+        self.children = [0] * 256  # codigo -> numero de entradas que o estendem
+        self.codes = {chr(i): i for i in range(256)}  # sequencia -> codigo
+        self.recency = OrderedDict()  # codigos aprendidos, do usado ha mais tempo ao mais recente
+        self.free_codes = []  # codigos liberados por remocoes
+        self.next_code = 256
+
+    # marca uma entrada como usada
+    def touch(self, code):
+        if code in self.recency:
+            self.recency.move_to_end(code)
+
+    # libera espaco para uma nova entrada de comprimento length e retorna o codigo que ela recebera
+    # protected e o prefixo da nova entrada, que nunca pode ser removido
+    # retorna None se nao houver como abrir espaco; nesse caso a entrada nao e adicionada
+    def reserve(self, length, protected):
+        cost = entry_cost(length)
+        if BASE_OVERHEAD + cost > self.memory_budget:
+            return None
+        while (not self.free_codes and self.next_code > self.max_code) or self.memory_used + cost > self.memory_budget:
+            if not self._evict(protected):
+                return None
+        if self.free_codes:
+            return self.free_codes.pop()
+        self.next_code += 1
+        return self.next_code - 1
+
+    # remove a folha usada ha mais tempo
+    # entradas internas encontradas no caminho voltam ao fim da fila, como se tivessem sido usadas
+    # complexidade O(1) amortizada
+    def _evict(self, protected):
+        for _ in range(len(self.recency)):
+            code, _ = self.recency.popitem(last=False)
+            if self.children[code] == 0 and code != protected:
+                string = self.strings[code]
+                self.strings[code] = None
+                del self.codes[string]
+                self.children[self.parent[code]] -= 1
+                self.memory_used -= entry_cost(len(string))
+                self.free_codes.append(code)
+                return True
+            self.recency[code] = None
+        return False
+
+    # adiciona a entrada string, extensao de parent, com o codigo reservado
+    def add(self, code, string, parent):
+        if code == len(self.strings):
+            self.strings.append(string)
+            self.parent.append(parent)
+            self.children.append(0)
+        else:
+            self.strings[code] = string
+            self.parent[code] = parent
+            self.children[code] = 0
+        self.codes[string] = code
+        self.children[parent] += 1
+        self.recency[code] = None
+        self.memory_used += entry_cost(len(string))
+
+
+class LZWCompressorLRU:
+    # compressor lzw que substitui folhas pouco usadas em vez de congelar o dicionario cheio
+    def __init__(self, max_bits=16, memory_budget=1 << 20):
+        self.max_bits = max_bits
+        self.dictionary = LRUDictionary(max_bits, memory_budget)
+
+    # complexidade O(n.m), como nas demais variantes
+    def compress(self, input_data):
+        codes = self.dictionary.codes
+        result = []
+        current_string = ""
+        for char in input_data:
+            combined_string = current_string + char
+            if combined_string in codes:
+                current_string = combined_string
+            else:
+                code = codes[current_string]
+                result.append(code)
+                self.dictionary.touch(code)
+
+                # aprende a nova sequencia, removendo uma folha antiga se necessario
+                slot = self.dictionary.reserve(len(combined_string), code)
+                if slot is not None:
+                    self.dictionary.add(slot, combined_string, code)
+                current_string = char
+
+        if current_string:
+            result.append(codes[current_string])
+        return result
+
+
+class LZWDecompressorLRU:
+    # descompressor que repete exatamente as reservas, insercoes e remocoes do compressor
+    def __init__(self, max_bits=16, memory_budget=1 << 20):
+        self.max_bits = max_bits
+        self.dictionary = LRUDictionary(max_bits, memory_budget)
+
+    def decompress(self, compressed_data):
+        return ''.join(self.decompress_iter(compressed_data))
+
+    # gera o texto em pedacos de aproximadamente chunk_size caracteres
+    def decompress_iter(self, compressed_data, chunk_size=65536):
+        strings = self.dictionary.strings
+        codes = iter(compressed_data)
+        previous_code = next(codes, None)
+        if previous_code is None:
+            return
+        current_string = strings[previous_code]
+        self.dictionary.touch(previous_code)
+        buffer = [current_string]
+        buffered = len(current_string)
+
+        for code in codes:
+            # o compressor aprendeu a entrada anterior antes de emitir este codigo
+            slot = self.dictionary.reserve(len(current_string) + 1, previous_code)
+            if code == slot:
+                entry = current_string + current_string[0]
+            elif code < len(strings) and strings[code] is not None:
+                entry = strings[code]
+            else:
+                raise ValueError("Invalid LZW code")
+            if slot is not None:
+                self.dictionary.add(slot, current_string + entry[0], previous_code)
+            self.dictionary.touch(code)
+
+            buffer.append(entry)
+            buffered += len(entry)
+            if buffered >= chunk_size:
+                yield ''.join(buffer)
+                buffer = []
+                buffered = 0
+
+            current_string = entry
+            previous_code = code
+
+        if buffer:
+            yield ''.join(buffer)
+
+
+# salva o cabecalho (max_bits e orcamento de memoria) e os codigos em um arquivo binario
+def write_compressed_file(output_path, compressed_data, max_bits, memory_budget):
+    with open(output_path, 'wb') as f:
+        f.write(max_bits.to_bytes(1, byteorder='big'))
+        f.write(memory_budget.to_bytes(4, byteorder='big'))
+        for code in compressed_data:
+            f.write(code.to_bytes(2, byteorder='big'))
+
+
+# le o cabecalho e gera os codigos sob demanda
+# retorna (max_bits, orcamento de memoria, iterador de codigos)
+def read_compressed_file(input_path):
+    with open(input_path, 'rb') as f:
+        max_bits = int.from_bytes(f.read(1), byteorder='big')
+        memory_budget = int.from_bytes(f.read(4), byteorder='big')
+
+    def codes():
+        with open(input_path, 'rb') as f:
+            f.seek(5)
+            while block := f.read(65536):
+                if len(block) % 2:
+                    raise ValueError("Arquivo comprimido truncado: termina no meio de um codigo")
+                for i in range(0, len(block), 2):
+                    yield int.from_bytes(block[i:i + 2], byteorder='big')
+
+    return max_bits, memory_budget, codes()
+
+
+def main():
+
+    # recebe os argumentos de entrada para a execucao do codigo
+    parser = argparse.ArgumentParser(description="LZW Compression/Decompression Tool with LRU dictionary replacement")
+    parser.add_argument("operation", choices=["compress", "decompress"], help="Operation to perform")
+    parser.add_argument("input_file", type=str, help="Path to input file")
+    parser.add_argument("output_file", type=str, help="Path to output file")
+    parser.add_argument("--max_bits", type=int, default=16, help="Maximum number of bits (default: 16)")
+    parser.add_argument("--memory_budget", type=int, default=1 << 20,
+                        help="Dictionary memory budget in bytes (default: 1048576)")
+
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.input_file):
+        print(f"Error: File '{args.input_file}' does not exist.")
+        return 1
+
+    if args.max_bits > 16:
+        print("Error: max_bits must be at most 16.")
+        return 1
+
+    if args.operation == "compress":
+        with open(args.input_file, 'rb') as f:
+            input_data = f.read().decode('latin1')
+
+        compressor = LZWCompressorLRU(max_bits=args.max_bits, memory_budget=args.memory_budget)
+        compressed_data = compressor.compress(input_data)
+        write_compressed_file(args.output_file, compressed_data, args.max_bits, args.memory_budget)
+        print(f"Arquivo comprimido salvo em: {args.output_file}")
+
+    elif args.operation == "decompress":
+        max_bits, memory_budget, compressed_data = read_compressed_file(args.input_file)
+
+        decompressor = LZWDecompressorLRU(max_bits=max_bits, memory_budget=memory_budget)
+        with open(args.output_file, 'w', encoding="latin1") as f:
+            for chunk in decompressor.decompress_iter(compressed_data):
+                f.write(chunk)
+        print(f"Arquivo descomprimido salvo em: {args.output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import os
+
+import pandas as pd
+
+# numero maximo de pontos por nivel de entropia nos graficos de dispersao
+SAMPLE_PER_LEVEL = 250
+# numero de faixas de tamanho de entrada usadas nos agregados
+SIZE_BUCKETS = 20
+
+
+# caminho de um dos arquivos derivados do CSV de resultados (ex.: lzw_analysis_by_level.parquet)
+def report_path(csv_file, name=""):
+    base = os.path.splitext(csv_file)[0]
+    return f"{base}{'_' + name if name else ''}.parquet"
+
+
+# le o CSV de resultados e grava o armazenamento colunar e os agregados usados pelo relatorio:
+# - resultados completos em parquet
+# - estatisticas descritivas
+# - medias por nivel de entropia
+# - medias por nivel de entropia e faixa de tamanho da entrada
+# - amostra estratificada por nivel para os graficos de dispersao
+# complexidade O(n log n), onde n e o numero de linhas do CSV
+def build_report_data(csv_file):
+    data = pd.read_csv(csv_file)
+    data["Compression Efficiency (%)"] = (1 - data["Compression Rate"]) * 100
+    data.to_parquet(report_path(csv_file), index=False)
+
+    data.describe().to_parquet(report_path(csv_file, "describe"))
+
+    metrics = [column for column in data.select_dtypes("number").columns if column not in ("Iteration", "Entropy Level")]
+    by_level = data.groupby("Entropy Level")[metrics].mean()
+    by_level["Count"] = data.groupby("Entropy Level").size()
+    by_level.reset_index().to_parquet(report_path(csv_file, "by_level"), index=False)
+
+    # faixas de mesma largura entre o menor e o maior tamanho de entrada
+    low, high = data["Input Size"].min(), data["Input Size"].max()
+    width = max(1, (high - low) / SIZE_BUCKETS)
+    buckets = ((data["Input Size"] - low) // width).clip(upper=SIZE_BUCKETS - 1).astype(int)
+    by_size = data.groupby(["Entropy Level", buckets.rename("Size Bucket")])[["Input Size", "Compression Rate"]].mean()
+    by_size["Count"] = data.groupby(["Entropy Level", buckets.rename("Size Bucket")]).size()
+    by_size.reset_index().to_parquet(report_path(csv_file, "by_size"), index=False)
+
+    # embaralha e mantem as primeiras linhas de cada nivel; ao contrario de groupby().apply,
+    # preserva a coluna do nivel em todas as versoes do pandas
+    sample = (data.sample(frac=1, random_state=0)
+              .groupby("Entropy Level").head(SAMPLE_PER_LEVEL)
+              .sort_index())
+    sample.to_parquet(report_path(csv_file, "sample"), index=False)
+
+
+# carrega apenas os agregados do relatorio, recalculando-os se o CSV for mais novo
+def load_report_data(csv_file):
+    names = ("describe", "by_level", "by_size", "sample")
+    paths = [report_path(csv_file, name) for name in names]
+    if not os.path.isfile(csv_file) and not all(os.path.isfile(path) for path in paths):
+        raise FileNotFoundError(csv_file)
+    if os.path.isfile(csv_file) and any(
+            not os.path.isfile(path) or os.path.getmtime(path) < os.path.getmtime(csv_file) for path in paths):
+        build_report_data(csv_file)
+    return {name: pd.read_parquet(path) for name, path in zip(names, paths)}
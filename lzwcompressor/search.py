@@ -0,0 +1,283 @@
+import argparse
+import os
+import sys
+from itertools import accumulate
+
+from . import dynamic, lzw
+
+EXPAND_CACHE = 1 << 16  # numero maximo de textos guardados por expand
+
+
+# busca de padroes diretamente na sequencia de codigos lzw, sem descomprimir o arquivo inteiro
+# o dicionario e reconstruido como no descompressor, mas cada entrada guarda apenas o codigo do
+# prefixo e alguns resumos sobre o padrao; o texto so e expandido nos trechos com ocorrencia
+# como o dicionario ainda e reconstruido codigo a codigo, o custo fica proximo ao de descomprimir
+# e procurar no texto; o ganho aparece so quando o padrao e raro
+class CompressedMatcher:
+
+    # monta o automato kmp do padrao e o dicionario inicial com os caracteres ascii
+    def __init__(self, pattern, max_bits=12):
+        if not pattern:
+            raise ValueError("O padrao de busca nao pode ser vazio")
+        self.pattern = pattern
+        self.m = len(pattern)
+        self.max_code = (1 << max_bits) - 1
+        self.dfa = self._build_dfa(pattern)
+        self.alphabet = frozenset(pattern)
+
+        # informacoes de cada entrada do dicionario, indexadas pelo codigo
+        self.parent = [None] * 256  # codigo do prefixo (None para caracteres simples)
+        self.char = [chr(i) for i in range(256)]  # ultimo caractere da entrada
+        self.first = list(self.char)  # primeiro caractere da entrada
+        self.length = [1] * 256  # comprimento da entrada
+        self.state = [self._step(0, char) for char in self.char]  # estado do automato apos ler a entrada
+        self.contains = [state == self.m for state in self.state]  # se o padrao ocorre dentro da entrada
+        self.newlines = [int(char == '\n') for char in self.char]  # numero de quebras de linha na entrada
+        self.initial = {i: char for i, char in enumerate(self.char)}
+        self.expanded = dict(self.initial)  # textos ja reconstruidos por expand
+        self.next_code = 256
+
+    # volta ao dicionario inicial com os caracteres ascii; cada varredura comeca dele
+    def _reset(self):
+        for values in (self.parent, self.char, self.first, self.length,
+                       self.state, self.contains, self.newlines):
+            del values[256:]
+        self.expanded = dict(self.initial)
+        self.next_code = 256
+
+    # automato kmp: dfa[q] mapeia os caracteres do padrao para o proximo estado
+    # caracteres fora do padrao sempre levam ao estado 0
+    # complexidade O(m.k), onde k e o numero de caracteres distintos do padrao
+    @staticmethod
+    def _build_dfa(pattern):
+        m = len(pattern)
+        alphabet = set(pattern)
+        failure = [0] * (m + 1)
+        dfa = [dict() for _ in range(m + 1)]
+        for q in range(m + 1):
+            for char in alphabet:
+                if q < m and pattern[q] == char:
+                    dfa[q][char] = q + 1
+                elif q == 0:
+                    dfa[q][char] = 0
+                else:
+                    dfa[q][char] = dfa[failure[q]][char]
+            if 0 < q < m:
+                failure[q + 1] = dfa[failure[q]].get(pattern[q], 0)
+        return dfa
+
+    def _step(self, state, char):
+        return self.dfa[state].get(char, 0)
+
+    # reconstroi o texto de uma entrada seguindo os codigos dos prefixos ate um ja reconstruido
+    # os textos ficam guardados, entao entradas repetidas nos trechos expandidos custam O(1);
+    # quando o cache chega a EXPAND_CACHE textos ele volta aos caracteres simples
+    # complexidade O(l), onde l e o comprimento da entrada
+    def expand(self, code):
+        expanded = self.expanded
+        text = expanded.get(code)
+        if text is None:
+            if len(expanded) >= EXPAND_CACHE:
+                expanded = self.expanded = dict(self.initial)
+            chars = []
+            node = code
+            while node not in expanded:
+                chars.append(self.char[node])
+                node = self.parent[node]
+            text = expanded[node] + ''.join(reversed(chars))
+            expanded[code] = text
+        return text
+
+    # ultimos count caracteres de uma entrada, em O(count)
+    def suffix(self, code, count):
+        chars = []
+        while code is not None and len(chars) < count:
+            chars.append(self.char[code])
+            code = self.parent[code]
+        return ''.join(reversed(chars))
+
+    # percorre os codigos reconstruindo o dicionario e retorna os indices dos codigos em cuja
+    # entrada termina alguma ocorrencia do padrao
+    # o automato so le os primeiros m-1 caracteres de uma entrada quando uma ocorrencia pode
+    # atravessar a fronteira, isto e, quando o estado nao e 0 e a entrada comeca por um caractere
+    # do padrao; nos demais casos o estado final da entrada ja e conhecido
+    # nada e gerado por codigo: posicoes e numeros de linha sao calculados depois, a partir dos
+    # comprimentos e das quebras de linha guardados no dicionario
+    # lines=True tambem conta as quebras de linha de cada entrada, usadas por grep
+    # complexidade O(n.m) no pior caso, onde n e o numero de codigos
+    def scan(self, compressed_data, lines=False):
+        self._reset()
+        m = self.m
+        steps = [transitions.get for transitions in self.dfa]
+        alphabet = self.alphabet
+        max_code = self.max_code
+        first, length, states, contains, newlines = self.first, self.length, self.state, self.contains, self.newlines
+        # metodos append guardados em variaveis locais: o laco roda uma vez por codigo
+        add_parent, add_char, add_first = self.parent.append, self.char.append, first.append
+        add_length, add_state, add_contains = length.append, states.append, contains.append
+        add_newlines = newlines.append
+
+        found = []
+        next_code = 256
+        state = 0
+        previous = None
+        for index, code in enumerate(compressed_data):
+            if code < next_code:
+                char = first[code]
+            elif code == next_code <= max_code and previous is not None:
+                char = first[previous]
+            else:
+                raise ValueError("Invalid LZW code")
+
+            if previous is not None and next_code <= max_code:
+                # adiciona a entrada formada pela anterior e o primeiro caractere desta, como no descompressor
+                entry_state = steps[states[previous]](char, 0)
+                add_parent(previous)
+                add_char(char)
+                add_first(first[previous])
+                add_length(length[previous] + 1)
+                add_state(entry_state)
+                add_contains(contains[previous] or entry_state == m)
+                if lines:
+                    add_newlines(newlines[previous] + (char == '\n'))
+                next_code += 1
+
+            if state == 0 or char not in alphabet:
+                state = states[code]
+                if contains[code]:
+                    found.append(index)
+            else:
+                # ocorrencias que comecam antes da entrada terminam nos seus primeiros m-1 caracteres
+                hit = contains[code]
+                for char in self.expand(code)[:m - 1]:
+                    state = steps[state](char, 0)
+                    if state == m:
+                        hit = True
+                if length[code] >= m:
+                    state = states[code]
+                if hit:
+                    found.append(index)
+            previous = code
+
+        self.next_code = next_code
+        return found
+
+    # retorna as posicoes (no texto descomprimido) de todas as ocorrencias do padrao
+    # o contexto antes de um codigo so e reconstruido quando ele tem ocorrencia
+    def search(self, compressed_data):
+        if not isinstance(compressed_data, list):
+            compressed_data = list(compressed_data)
+        found = self.scan(compressed_data)
+        if not found:
+            return []
+        # positions[i] e a posicao no texto em que o codigo i comeca
+        positions = list(accumulate(map(self.length.__getitem__, compressed_data), initial=0))
+        m = self.m
+        matches = []
+        for index in found:
+            code = compressed_data[index]
+            # ultimos m-1 caracteres antes do codigo atual
+            context = ""
+            previous_index = index - 1
+            while len(context) < m - 1 and previous_index >= 0:
+                context = self.suffix(compressed_data[previous_index], m - 1 - len(context)) + context
+                previous_index -= 1
+            window = context + self.expand(code)
+            start = window.find(self.pattern)
+            while start != -1:
+                if start + m > len(context):
+                    matches.append(positions[index] - len(context) + start)
+                start = window.find(self.pattern, start + 1)
+        return matches
+
+    # gera (numero da linha, linha) para cada linha que contem o padrao
+    # apenas as linhas em que um codigo com ocorrencia comeca ou termina sao expandidas
+    def grep(self, compressed_data):
+        if '\n' in self.pattern:
+            raise ValueError("O padrao de busca nao pode conter quebra de linha")
+        if not isinstance(compressed_data, list):
+            compressed_data = list(compressed_data)
+        found = self.scan(compressed_data, lines=True)
+        if not found:
+            return
+        newlines = self.newlines
+        count = newlines.__getitem__
+        last = len(compressed_data) - 1
+        line_number = 1  # numero da linha em que o codigo counted comeca
+        counted = 0
+        last_line = 0  # ultima linha ja verificada
+        for index in found:
+            line_number += sum(map(count, compressed_data[counted:index]))
+            counted = index
+            final_line = line_number + newlines[compressed_data[index]]
+            if final_line <= last_line:
+                continue
+            # o trecho vai do codigo com a quebra de linha anterior ao codigo ate o com a seguinte
+            start = index - 1
+            while start >= 0 and not newlines[compressed_data[start]]:
+                start -= 1
+            end = index + 1
+            while end <= last and not newlines[compressed_data[end]]:
+                end += 1
+            parts = [self.expand(code) for code in compressed_data[max(start, 0):end + 1]]
+            text = ''.join(parts)
+            if end <= last:
+                text = text[:len(text) - len(parts[-1]) + parts[-1].index('\n')]
+            if start >= 0:
+                text = text[parts[0].rindex('\n') + 1:]
+            for number, line in enumerate(text.split('\n'), line_number):
+                if number > last_line and self.pattern in line:
+                    yield number, line
+            last_line = final_line
+
+
+# funcoes de conveniencia sobre uma lista de codigos
+def search(compressed_data, pattern, max_bits=12):
+    return CompressedMatcher(pattern, max_bits).search(compressed_data)
+
+
+def grep(compressed_data, pattern, max_bits=12):
+    return CompressedMatcher(pattern, max_bits).grep(compressed_data)
+
+
+def main():
+
+    # recebe os argumentos de entrada para a execucao do codigo
+    parser = argparse.ArgumentParser(description="Search for a pattern inside an LZW compressed file without decompressing it")
+    parser.add_argument("pattern", type=str, help="Pattern to search for")
+    parser.add_argument("input_file", type=str, help="Path to compressed file")
+    parser.add_argument("--max_bits", type=int, default=12, help="Maximum number of bits (default: 12)")
+    parser.add_argument("--dynamic", action="store_true", help="Input was produced by dynamic.py")
+    parser.add_argument("-n", "--line-number", action="store_true", help="Prefix each line with its line number")
+    parser.add_argument("-c", "--count", action="store_true", help="Print only the number of matching lines")
+
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.input_file):
+        print(f"Error: File '{args.input_file}' does not exist.")
+        return 1
+
+    # leitura do arquivo comprimido no formato do compressor correspondente
+    if args.dynamic:
+        compressed_data, max_bits = dynamic.read_compressed_file(args.input_file)
+    else:
+        compressed_data, max_bits = lzw.read_compressed_file(args.input_file), args.max_bits
+
+    count = 0
+    try:
+        for line_number, line in grep(compressed_data, args.pattern, max_bits):
+            count += 1
+            if args.count:
+                continue
+            print(f"{line_number}:{line}" if args.line_number else line)
+        if args.count:
+            print(count)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # a saida foi fechada antes do fim (por exemplo, por head); redireciona stdout para
+        # /dev/null para que o python nao tente escrever nela de novo ao encerrar
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+if __name__ == "__main__":
+    main()
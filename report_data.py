@@ -0,0 +1,2 @@
+# atalho para importar a partir do repositorio; o codigo fica em lzwcompressor/report_data.py
+from lzwcompressor.report_data import *  # noqa: F401,F403
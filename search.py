@@ -0,0 +1,6 @@
+# atalho para executar a partir do repositorio (python search.py ...); o codigo fica em lzwcompressor/search.py
+from lzwcompressor.search import *  # noqa: F401,F403
+from lzwcompressor.search import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# mede o tempo de inicializacao de cada subcomando de codec e verifica que nenhum deles
+# importa as dependencias pesadas da analise; termina com erro se houver regressao
+
+# subcomandos que devem depender apenas da biblioteca padrao
+CODEC_COMMANDS = ["lzw", "dynamic", "auto", "lru", "blocks", "archive", "dedup", "grep"]
+
+# modulos que nao podem ser carregados no caminho dos codecs
+HEAVY_MODULES = {"numpy", "pandas", "matplotlib", "streamlit", "sklearn", "scipy", "pyarrow"}
+
+
+# executa o interpretador com args; uma execucao que falha invalida a medicao
+def _run(args):
+    result = subprocess.run([sys.executable, *args], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(f"python {' '.join(args)} terminou com codigo {result.returncode}:\n{result.stderr}")
+    return result
+
+
+# tempo mediano, em milissegundos, de runs execucoes do interpretador com args
+def measure(args, runs):
+    times = []
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        _run(args)
+        times.append((time.perf_counter() - start_time) * 1000)
+    return statistics.median(times)
+
+
+# modulos de nivel mais alto importados por um subcomando, segundo -X importtime
+def imported_modules(command):
+    result = _run(["-X", "importtime", "-m", "lzwcompressor", command, "--help"])
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            modules.add(name.split(".")[0])
+    return modules
+
+
+def main():
+
+    # recebe os argumentos de entrada para a execucao do codigo
+    parser = argparse.ArgumentParser(description="Start-up time benchmark for the codec entry points")
+    parser.add_argument("--runs", type=int, default=15, help="Runs per command (default: 15)")
+    parser.add_argument("--max_overhead_ms", type=float, default=100.0,
+                        help="Maximum start-up time above a bare interpreter, in ms (default: 100)")
+
+    args = parser.parse_args()
+
+    baseline = measure(["-c", "pass"], args.runs)
+    print(f"{'python -c pass':<16} {baseline:8.1f} ms")
+
+    failures = []
+    for command in CODEC_COMMANDS:
+        try:
+            heavy = sorted(imported_modules(command) & HEAVY_MODULES)
+            elapsed = measure(["-m", "lzwcompressor", command, "--help"], args.runs)
+        except RuntimeError as error:
+            failures.append(f"{command}: {error}")
+            continue
+        overhead = elapsed - baseline
+        print(f"{command:<16} {elapsed:8.1f} ms  (+{overhead:.1f} ms)")
+        if heavy:
+            failures.append(f"{command}: importa {', '.join(heavy)}")
+        if overhead > args.max_overhead_ms:
+            failures.append(f"{command}: +{overhead:.1f} ms acima do limite de {args.max_overhead_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"Regressão: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())